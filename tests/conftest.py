@@ -0,0 +1,120 @@
+"""Shared pytest fixtures for the To-Do CLI test suite."""
+
+import copy
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+import pytest
+
+from todo_cli.models.config import Config
+from todo_cli.models.task import Task, TaskPriority, TaskStatus
+from todo_cli.models.task_list import TaskList
+
+# Fixed creation timestamp for tasks built by _fast_task
+_FROZEN_NOW = datetime(2026, 1, 1, 9, 0, 0)
+
+# String -> enum maps; str-based members hash like their values, so both resolve
+_PRIORITY = {p.value: p for p in TaskPriority}
+_STATUS = {s.value: s for s in TaskStatus}
+
+
+def _fast_task(id: int, title: str, **kwargs: Any) -> Task:
+    """
+    Build a Task without running the dataclass __init__.
+
+    Skips the datetime.now() default and the Enum constructor; status and
+    priority may be given as enum members or plain strings.
+
+    Args:
+        id: Task identifier.
+        title: Task title.
+        **kwargs: Field overrides (status, priority, tags, ...).
+
+    Returns:
+        Task instance.
+    """
+    task = object.__new__(Task)
+    task.__dict__.update(
+        id=id,
+        title=title,
+        status=TaskStatus.PENDING,
+        priority=TaskPriority.MEDIUM,
+        tags=[],
+        project=None,
+        created_at=_FROZEN_NOW,
+        due_date=None,
+    )
+    task.__dict__.update(kwargs)
+    task.status = _STATUS[task.status]
+    task.priority = _PRIORITY[task.priority]
+    return task
+
+
+def _fast_task_list(*tasks: Task) -> TaskList:
+    """Wrap prebuilt tasks in a TaskList with a consistent next_id."""
+    return TaskList(tasks=list(tasks), next_id=max((t.id for t in tasks), default=0) + 1)
+
+
+@pytest.fixture(scope="session")
+def _base_config(tmp_path_factory: pytest.TempPathFactory) -> Mapping:
+    """Create the read-only config values shared by the whole session."""
+    return MappingProxyType(
+        {
+            "data_dir": tmp_path_factory.mktemp("data", numbered=False),
+            "default_priority": "medium",
+            "default_tags": [],
+            "show_completed": True,
+            "color_enabled": False,  # Disable color for tests
+            "date_format": "%Y-%m-%d",
+            "editor": None,
+            "sort_by": "priority",
+            "sort_reverse": False,
+            "aliases": {},
+        }
+    )
+
+
+@pytest.fixture
+def temp_config(_base_config: Mapping) -> Config:
+    """Create a per-test config with its own copies of the mutable defaults."""
+    return Config.from_dict(copy.deepcopy({**_base_config}))
+
+
+@pytest.fixture
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Pin the clock used by Task.is_overdue to a fixed instant."""
+    now = datetime(2025, 1, 1)
+    monkeypatch.setattr("todo_cli.models.task._now", lambda: now)
+    return now
+
+
+@pytest.fixture(scope="session")
+def _sample_tasks_template() -> TaskList:
+    """Build the mixed pending/completed sample list once per session."""
+    return _fast_task_list(
+        _fast_task(1, "Pending high priority", priority="high", tags=["work"]),
+        _fast_task(2, "Completed task", priority="low", status="completed"),
+        _fast_task(3, "Pending low priority", priority="low", tags=["personal"]),
+    )
+
+
+@pytest.fixture(scope="session")
+def _search_tasks_template() -> TaskList:
+    """Build the tagged sample list used by search tests once per session."""
+    return _fast_task_list(
+        _fast_task(1, "Electricity bill", tags=["finance"]),
+        _fast_task(2, "Grocery shopping", tags=["shopping"]),
+        _fast_task(3, "Code review", tags=["work", "urgent"]),
+        _fast_task(4, "Meeting notes", tags=["meeting", "work"]),
+    )
+
+
+@pytest.fixture(scope="session")
+def make_task_list() -> Callable[..., TaskList]:
+    """Provide a builder for task lists that bypasses TaskList.add."""
+
+    def build(*specs: Mapping) -> TaskList:
+        return _fast_task_list(*(_fast_task(i, **spec) for i, spec in enumerate(specs, 1)))
+
+    return build
@@ -1,11 +1,22 @@
 """Unit tests for CLI commands."""
 
+import copy
+import dataclasses
+import io
+import re
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator
+from unittest.mock import MagicMock
 
 import pytest
+import typer
+from pytest_mock import MockerFixture
+from rich.console import Console
 
+from todo_cli import context
+from todo_cli.commands import delete as delete_mod
 from todo_cli.commands.add import add_task
 from todo_cli.commands.delete import delete_task
 from todo_cli.commands.done import mark_done
@@ -13,158 +24,186 @@ from todo_cli.commands.edit import edit_task
 from todo_cli.commands.list_cmd import list_tasks
 from todo_cli.commands.search import search_tasks
 from todo_cli.commands.undo import mark_undo
-from todo_cli.models.task import TaskPriority, TaskStatus
+from todo_cli.display import formatter
+from todo_cli.display.formatter import DisplayFormatter
+from todo_cli.main import undo_last
+from todo_cli.models.config import Config
+from todo_cli.models.task import Task, TaskPriority, TaskStatus
 from todo_cli.models.task_list import TaskList
+from todo_cli.storage import storage_manager
+from todo_cli.storage.storage_manager import StorageManager
+from todo_cli.utils import undo_manager
+from todo_cli.utils.undo_manager import UndoManager
+
+
+@pytest.fixture(scope="session")
+def _collaborator_templates() -> Dict[str, MagicMock]:
+    """Create one spec'd instance mock per command collaborator."""
+    return {
+        "storage": MagicMock(spec=StorageManager),
+        "formatter": MagicMock(spec=DisplayFormatter),
+        "undo": MagicMock(spec=UndoManager),
+    }
+
+
+@pytest.fixture
+def collaborators(_collaborator_templates: Dict[str, MagicMock]) -> Iterator[Dict[str, MagicMock]]:
+    """Hand out the shared instance mocks and reset them after each test."""
+    yield _collaborator_templates
+    for mock in _collaborator_templates.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+def _patch_command(
+    mocker: MockerFixture,
+    config: Config,
+    collaborators: Dict[str, MagicMock],
+    undo: bool = False,
+) -> SimpleNamespace:
+    """
+    Patch the collaborators the app context hands to commands in one go.
+
+    Args:
+        mocker: pytest-mock fixture that owns the patches.
+        config: Config returned by the patched get_config.
+        collaborators: Spec'd instance mocks returned by the patched classes.
+        undo: Whether the module also uses an UndoManager.
+
+    Returns:
+        Namespace holding the config, storage, formatter and undo mocks.
+    """
+    # The app context imports these at first use, so patch where they're defined
+    mocks = SimpleNamespace(
+        config=mocker.patch.object(context, "get_config", return_value=config),
+        storage=mocker.patch.object(
+            storage_manager, "StorageManager", return_value=collaborators["storage"]
+        ),
+        formatter=mocker.patch.object(
+            formatter, "DisplayFormatter", return_value=collaborators["formatter"]
+        ),
+        undo=None,
+    )
+    if undo:
+        mocks.undo = mocker.patch.object(
+            undo_manager, "UndoManager", return_value=collaborators["undo"]
+        )
+    return mocks
 
 
 class TestAddCommand:
     """Tests for add task command."""
 
-    @pytest.fixture
-    def temp_config(self, tmp_path: Path) -> dict:
-        """Create a temporary config for testing."""
-        return {
-            "data_dir": tmp_path,
-            "default_priority": "medium",
-            "default_tags": [],
-            "show_completed": True,
-            "color_enabled": False,  # Disable color for tests
-            "date_format": "%Y-%m-%d",
-            "editor": None,
-            "sort_by": "priority",
-            "sort_reverse": False,
-            "aliases": {},
-        }
-
-    @patch("todo_cli.commands.add.ConfigLoader")
-    @patch("todo_cli.commands.add.StorageManager")
-    @patch("todo_cli.commands.add.DisplayFormatter")
-    def test_add_simple_task(
-        self, mock_formatter, mock_storage, mock_config_loader, temp_config
-    ) -> None:
-        """Test adding a simple task."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = TaskList()
-        mock_storage.return_value.save.return_value = None
-
-        add_task("New task")
-
-        # Verify task was added
-        mock_storage.return_value.add.assert_called_once_with(
-            "New task",
-            priority="medium",
-            tags=[],
-            project=None,
-            due_date=None,
-        )
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch the add command's collaborators."""
+        return _patch_command(mocker, temp_config, collaborators)
 
-        # Verify saved
-        mock_storage.return_value.save.assert_called_once()
+    @pytest.fixture
+    def task_list(self, mocks: SimpleNamespace) -> TaskList:
+        """Create an empty task list served by the patched storage."""
+        task_list = TaskList()
+        mocks.storage.return_value.load.return_value = task_list
+        return task_list
 
-    @patch("todo_cli.commands.add.ConfigLoader")
-    @patch("todo_cli.commands.add.StorageManager")
-    @patch("todo_cli.commands.add.DisplayFormatter")
-    def test_add_task_with_priority(
-        self, mock_formatter, mock_storage, mock_config_loader, temp_config
+    @pytest.mark.parametrize(
+        "kwargs,check",
+        [
+            (
+                {},
+                lambda t: t.priority == TaskPriority.MEDIUM
+                and t.tags == []
+                and t.project is None
+                and t.due_date is None,
+            ),
+            ({"priority": "high"}, lambda t: t.priority == TaskPriority.HIGH),
+            ({"tag": ["urgent", "work"]}, lambda t: "urgent" in t.tags and "work" in t.tags),
+            ({"due": "2026-01-15"}, lambda t: t.due_date is not None),
+        ],
+        ids=["simple", "priority", "tags", "due_date"],
+    )
+    def test_add_task_variants(
+        self,
+        mocks: SimpleNamespace,
+        task_list: TaskList,
+        kwargs: dict,
+        check: Callable[[Task], bool],
     ) -> None:
-        """Test adding task with priority."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = TaskList()
-        mock_storage.return_value.save.return_value = None
-
-        add_task("Task with priority", priority="high")
-
-        # Verify priority was set
-        added_task = mock_storage.return_value.add.call_args[0]
-        assert added_task[1]["priority"] == "high"
-
-    @patch("todo_cli.commands.add.ConfigLoader")
-    @patch("todo_cli.commands.add.StorageManager")
-    @patch("todo_cli.commands.add.DisplayFormatter")
-    def test_add_task_with_tags(
-        self, mock_formatter, mock_storage, mock_config_loader, temp_config
-    ) -> None:
-        """Test adding task with tags."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = TaskList()
-        mock_storage.return_value.save.return_value = None
-
-        add_task("Tagged task", tag=["urgent", "work"])
-
-        # Verify tags were processed
-        added_task = mock_storage.return_value.add.call_args[0]
-        assert "urgent" in added_task[1]["tags"]
-        assert "work" in added_task[1]["tags"]
-
-    @patch("todo_cli.commands.add.ConfigLoader")
-    @patch("todo_cli.commands.add.StorageManager")
-    @patch("todo_cli.commands.add.DisplayFormatter")
-    def test_add_task_with_due_date(
-        self, mock_formatter, mock_storage, mock_config_loader, temp_config
-    ) -> None:
-        """Test adding task with due date."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = TaskList()
-        mock_storage.return_value.save.return_value = None
+        """Test adding a task with each supported option."""
+        options = {"priority": "medium", "tag": [], "project": None, "due": None, **kwargs}
 
-        add_task("Task with due date", due="2026-01-15")
+        add_task("New task", **options)
 
-        # Verify due date was parsed
-        added_task = mock_storage.return_value.add.call_args[0]
-        assert added_task[1]["due_date"] is not None
+        # Verify task was added with the requested attributes
+        assert len(task_list.tasks) == 1
+        assert task_list.tasks[0].title == "New task"
+        assert check(task_list.tasks[0])
+
+        # Verify saved
+        mocks.storage.return_value.save.assert_called_once_with(task_list)
 
 
 class TestListCommand:
     """Tests for list tasks command."""
 
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch the list command's collaborators."""
+        return _patch_command(mocker, temp_config, collaborators)
+
     @pytest.fixture
-    def task_list_with_tasks(self) -> TaskList:
+    def task_list_with_tasks(
+        self, mocks: SimpleNamespace, _sample_tasks_template: TaskList
+    ) -> TaskList:
         """Create task list with sample tasks."""
-        task_list = TaskList()
-        task_list.add("Pending high priority", priority="high", tags=["work"])
-        task_list.add("Completed task", priority="low", status="completed")
-        task_list.add("Pending low priority", priority="low", tags=["personal"])
+        task_list = copy.deepcopy(_sample_tasks_template)
+        mocks.storage.return_value.load.return_value = task_list
         return task_list
 
-    @pytest.fixture
-    def temp_config(self, tmp_path: Path) -> dict:
-        """Create a temporary config for testing."""
-        return {
-            "data_dir": tmp_path,
-            "show_completed": True,
-            "color_enabled": False,
-            "date_format": "%Y-%m-%d",
-        }
-
-    @patch("todo_cli.commands.list_cmd.ConfigLoader")
-    @patch("todo_cli.commands.list_cmd.StorageManager")
-    @patch("todo_cli.commands.list_cmd.DisplayFormatter")
-    def test_list_all_tasks(
-        self, mock_formatter, mock_storage, mock_config_loader, task_list_with_tasks, temp_config
-    ) -> None:
+    def test_list_all_tasks(self, mocks: SimpleNamespace, task_list_with_tasks: TaskList) -> None:
         """Test listing all tasks."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list_with_tasks
-
-        list_tasks()
+        list_tasks(
+            all=False,
+            pending=False,
+            completed=False,
+            tag=None,
+            project=None,
+            overdue=False,
+            sort="priority",
+            reverse=False,
+            limit=None,
+        )
 
         # Verify tasks were displayed
-        mock_formatter.return_value.format_task_table.assert_called_once()
+        mocks.formatter.return_value.format_task_table.assert_called_once()
 
-    @patch("todo_cli.commands.list_cmd.ConfigLoader")
-    @patch("todo_cli.commands.list_cmd.StorageManager")
-    @patch("todo_cli.commands.list_cmd.DisplayFormatter")
     def test_list_pending_only(
-        self, mock_formatter, mock_storage, mock_config_loader, task_list_with_tasks, temp_config
+        self, mocks: SimpleNamespace, task_list_with_tasks: TaskList
     ) -> None:
         """Test listing pending tasks only."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list_with_tasks
-
-        list_tasks(pending=True)
+        list_tasks(
+            all=False,
+            pending=True,
+            completed=False,
+            tag=None,
+            project=None,
+            overdue=False,
+            sort="priority",
+            reverse=False,
+            limit=None,
+        )
 
         # Verify only pending tasks shown
-        call_args = mock_formatter.return_value.format_task_table.call_args
+        call_args = mocks.formatter.return_value.format_task_table.call_args
         displayed_tasks = call_args[0][0]
         assert len(displayed_tasks) == 2  # Only pending tasks
 
@@ -172,233 +211,357 @@ class TestListCommand:
 class TestDoneCommand:
     """Tests for mark task as completed command."""
 
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch the done command's collaborators."""
+        return _patch_command(mocker, temp_config, collaborators, undo=True)
+
     @pytest.fixture
-    def task_list(self) -> TaskList:
+    def task_list(
+        self, mocks: SimpleNamespace, make_task_list: Callable[..., TaskList]
+    ) -> TaskList:
         """Create task list with pending task."""
-        task_list = TaskList()
-        task_list.add("Task to complete", priority="high")
+        task_list = make_task_list({"title": "Task to complete", "priority": "high"})
+        mocks.storage.return_value.load.return_value = task_list
         return task_list
 
-    @pytest.fixture
-    def temp_config(self, tmp_path: Path) -> dict:
-        """Create a temporary config for testing."""
-        return {
-            "data_dir": tmp_path,
-            "color_enabled": False,
-        }
-
-    @patch("todo_cli.commands.done.ConfigLoader")
-    @patch("todo_cli.commands.done.StorageManager")
-    @patch("todo_cli.commands.done.UndoManager")
-    @patch("todo_cli.commands.done.DisplayFormatter")
-    def test_mark_task_completed(
-        self, mock_formatter, mock_storage, mock_undo, mock_config_loader, task_list, temp_config
-    ) -> None:
+    def test_mark_task_completed(self, mocks: SimpleNamespace, task_list: TaskList) -> None:
         """Test marking task as completed."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list
-        mock_storage.return_value.save.return_value = None
-        mock_undo.return_value.record_complete.return_value = None
         task = task_list.get_by_id(1)
 
         mark_done(1)
 
         # Verify task was marked completed
         assert task.status == TaskStatus.COMPLETED
-        mock_storage.return_value.save.assert_called_once()
-        mock_undo.return_value.record_complete.assert_called_once_with(task)
+        mocks.storage.return_value.save.assert_called_once()
+        mocks.undo.return_value.record_complete.assert_called_once_with(task)
 
 
 class TestUndoCommand:
     """Tests for mark task as incomplete command."""
 
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch the undo command's collaborators."""
+        return _patch_command(mocker, temp_config, collaborators)
+
     @pytest.fixture
-    def task_list(self) -> TaskList:
+    def task_list(
+        self, mocks: SimpleNamespace, make_task_list: Callable[..., TaskList]
+    ) -> TaskList:
         """Create task list with completed task."""
-        task_list = TaskList()
-        task_list.add("Completed task", priority="high", status="completed")
+        task_list = make_task_list(
+            {"title": "Completed task", "priority": "high", "status": "completed"}
+        )
+        mocks.storage.return_value.load.return_value = task_list
         return task_list
 
-    @pytest.fixture
-    def temp_config(self, tmp_path: Path) -> dict:
-        """Create a temporary config for testing."""
-        return {
-            "data_dir": tmp_path,
-            "color_enabled": False,
-        }
-
-    @patch("todo_cli.commands.undo.ConfigLoader")
-    @patch("todo_cli.commands.undo.StorageManager")
-    @patch("todo_cli.commands.undo.DisplayFormatter")
-    def test_mark_task_incomplete(
-        self, mock_formatter, mock_storage, mock_config_loader, task_list, temp_config
-    ) -> None:
+    def test_mark_task_incomplete(self, mocks: SimpleNamespace, task_list: TaskList) -> None:
         """Test marking completed task as incomplete."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list
-        mock_storage.return_value.save.return_value = None
         task = task_list.get_by_id(1)
 
         mark_undo(1)
 
         # Verify task was marked pending
         assert task.status == TaskStatus.PENDING
-        mock_storage.return_value.save.assert_called_once()
+        mocks.storage.return_value.save.assert_called_once()
+
+
+class TestUndoLast:
+    """Tests for undoing the last delete, edit or complete end to end."""
+
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        tmp_path: Path,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch storage and output but keep a real undo journal in a temp dir."""
+        config = dataclasses.replace(temp_config, data_dir=tmp_path)
+        return _patch_command(mocker, config, collaborators)
+
+    @pytest.fixture
+    def task_list(
+        self, mocks: SimpleNamespace, make_task_list: Callable[..., TaskList]
+    ) -> TaskList:
+        """Create task list with one fully populated task."""
+        task_list = make_task_list(
+            {
+                "title": "Original title",
+                "priority": "high",
+                "tags": ["work", "urgent"],
+                "project": "Alpha",
+                "due_date": datetime(2026, 3, 1),
+            }
+        )
+        mocks.storage.return_value.load.return_value = task_list
+        return task_list
+
+    def test_undo_delete_restores_task(self, task_list: TaskList) -> None:
+        """Test undoing a delete brings the task back with all its fields."""
+        delete_task(1, confirm=True)
+        assert task_list.tasks == []
+
+        undo_last()
+
+        (task,) = task_list.tasks
+        assert task.title == "Original title"
+        assert task.priority == TaskPriority.HIGH
+        assert task.tags == ["work", "urgent"]
+        assert task.project == "Alpha"
+        assert task.due_date == datetime(2026, 3, 1)
+
+    def test_undo_edit_restores_previous_values(self, task_list: TaskList) -> None:
+        """Test undoing an edit reverts every changed field and nothing else."""
+        edit_task(
+            1, title="New title", priority="low", tag=["home"], project="Beta", due="2026-04-01"
+        )
+
+        undo_last()
+
+        task = task_list.get_by_id(1)
+        assert task.title == "Original title"
+        assert task.priority == TaskPriority.HIGH
+        assert task.tags == ["work", "urgent"]
+        assert task.project == "Alpha"
+        assert task.due_date == datetime(2026, 3, 1)
+
+    def test_undo_complete_marks_task_pending(self, task_list: TaskList) -> None:
+        """Test undoing a completion puts the task back to pending."""
+        mark_done(1)
+        assert task_list.get_by_id(1).status == TaskStatus.COMPLETED
+
+        undo_last()
+
+        task = task_list.get_by_id(1)
+        assert task.status == TaskStatus.PENDING
+        assert task.title == "Original title"
 
 
 class TestEditCommand:
     """Tests for edit task command."""
 
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch the edit command's collaborators."""
+        return _patch_command(mocker, temp_config, collaborators, undo=True)
+
     @pytest.fixture
-    def task_list(self) -> TaskList:
+    def task_list(
+        self, mocks: SimpleNamespace, make_task_list: Callable[..., TaskList]
+    ) -> TaskList:
         """Create task list with task to edit."""
-        task_list = TaskList()
-        task_list.add("Original title", priority="medium")
+        task_list = make_task_list({"title": "Original title"})
+        mocks.storage.return_value.load.return_value = task_list
         return task_list
 
-    @pytest.fixture
-    def temp_config(self, tmp_path: Path) -> dict:
-        """Create a temporary config for testing."""
-        return {
-            "data_dir": tmp_path,
-            "color_enabled": False,
-        }
-
-    @patch("todo_cli.commands.edit.ConfigLoader")
-    @patch("todo_cli.commands.edit.StorageManager")
-    @patch("todo_cli.commands.edit.UndoManager")
-    @patch("todo_cli.commands.edit.DisplayFormatter")
-    def test_edit_task_title(
-        self, mock_formatter, mock_storage, mock_undo, mock_config_loader, task_list, temp_config
-    ) -> None:
+    def test_edit_task_title(self, mocks: SimpleNamespace, task_list: TaskList) -> None:
         """Test editing task title."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list
-        mock_storage.return_value.save.return_value = None
-        mock_undo.return_value.record_edit.return_value = None
-
-        edit_task(1, title="Updated title")
+        edit_task(1, title="Updated title", priority=None, tag=[], project=None, due=None)
 
         # Verify task was updated
         task = task_list.get_by_id(1)
         assert task.title == "Updated title"
-        mock_storage.return_value.save.assert_called_once()
+        mocks.storage.return_value.save.assert_called_once()
+
+    def test_edit_records_only_changed_fields(
+        self, mocks: SimpleNamespace, task_list: TaskList
+    ) -> None:
+        """Test the undo record holds just the previous values of edited fields."""
+        edit_task(1, title="Updated title", priority=None, tag=[], project="Home", due=None)
+
+        _, previous_state = mocks.undo.return_value.record_edit.call_args[0]
+        assert previous_state == {"title": "Original title", "project": None}
 
 
 class TestDeleteCommand:
     """Tests for delete task command."""
 
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch the delete command's collaborators and the confirmation prompt."""
+        mocks = _patch_command(mocker, temp_config, collaborators, undo=True)
+        mocks.confirm = mocker.patch.object(typer, "confirm")
+        return mocks
+
     @pytest.fixture
-    def task_list(self) -> TaskList:
+    def task_list(
+        self, mocks: SimpleNamespace, make_task_list: Callable[..., TaskList]
+    ) -> TaskList:
         """Create task list with task to delete."""
-        task_list = TaskList()
-        task_list.add("Task to delete", priority="high")
+        task_list = make_task_list({"title": "Task to delete", "priority": "high"})
+        mocks.storage.return_value.load.return_value = task_list
         return task_list
 
-    @pytest.fixture
-    def temp_config(self, tmp_path: Path) -> dict:
-        """Create a temporary config for testing."""
-        return {
-            "data_dir": tmp_path,
-            "color_enabled": False,
-        }
-
-    @patch("todo_cli.commands.delete.ConfigLoader")
-    @patch("todo_cli.commands.delete.StorageManager")
-    @patch("todo_cli.commands.delete.UndoManager")
-    @patch("todo_cli.commands.delete.DisplayFormatter")
-    @patch("typer.confirm")
     def test_delete_task(
-        self, mock_confirm, mock_formatter, mock_storage, mock_undo, mock_config_loader, task_list, temp_config
+        self, mocker: MockerFixture, mocks: SimpleNamespace, task_list: TaskList
     ) -> None:
         """Test deleting a task with confirmation."""
-        mock_confirm.return_value = True
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list
-        mock_storage.return_value.save.return_value = None
-        mock_undo.return_value.record_delete.return_value = None
+        mocker.patch.object(delete_mod, "_STDIN_IS_TTY", True)
+        mocks.confirm.return_value = True
 
-        delete_task(1)
+        delete_task(1, confirm=False)
 
         # Verify task was deleted
         assert len(task_list.tasks) == 0
-        mock_storage.return_value.save.assert_called_once()
-        mock_undo.return_value.record_delete.assert_called_once()
-
-    @patch("todo_cli.commands.delete.ConfigLoader")
-    @patch("todo_cli.commands.delete.StorageManager")
-    @patch("todo_cli.commands.delete.UndoManager")
-    @patch("todo_cli.commands.delete.DisplayFormatter")
-    @patch("typer.confirm")
+        mocks.storage.return_value.save.assert_called_once()
+        mocks.undo.return_value.record_delete.assert_called_once()
+
     def test_delete_task_skip_confirmation(
-        self, mock_confirm, mock_formatter, mock_storage, mock_undo, mock_config_loader, task_list, temp_config
+        self, mocks: SimpleNamespace, task_list: TaskList
     ) -> None:
         """Test deleting a task without confirmation."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list
-        mock_storage.return_value.save.return_value = None
-        mock_undo.return_value.record_delete.return_value = None
-
         delete_task(1, confirm=True)
 
         # Verify confirmation was skipped
-        mock_confirm.assert_not_called()
-        mock_storage.return_value.save.assert_called_once()
+        mocks.confirm.assert_not_called()
+        mocks.storage.return_value.save.assert_called_once()
+
+    def test_delete_task_non_interactive_requires_yes(
+        self, mocker: MockerFixture, mocks: SimpleNamespace, task_list: TaskList
+    ) -> None:
+        """Test deleting without --yes is refused when stdin isn't a terminal."""
+        mocker.patch.object(delete_mod, "_STDIN_IS_TTY", False)
+
+        with pytest.raises(typer.Exit):
+            delete_task(1, confirm=False)
+
+        # Verify nothing was prompted or deleted
+        mocks.confirm.assert_not_called()
+        assert len(task_list.tasks) == 1
+        mocks.storage.return_value.save.assert_not_called()
 
 
 class TestSearchCommand:
     """Tests for search tasks command."""
 
+    @pytest.fixture(autouse=True)
+    def mocks(
+        self,
+        mocker: MockerFixture,
+        temp_config: Config,
+        collaborators: Dict[str, MagicMock],
+    ) -> SimpleNamespace:
+        """Patch the search command's collaborators."""
+        return _patch_command(mocker, temp_config, collaborators)
+
     @pytest.fixture
-    def task_list(self) -> TaskList:
+    def task_list(self, mocks: SimpleNamespace, _search_tasks_template: TaskList) -> TaskList:
         """Create task list with various tasks."""
-        task_list = TaskList()
-        task_list.add("Electricity bill", tags=["finance"])
-        task_list.add("Grocery shopping", tags=["shopping"])
-        task_list.add("Code review", tags=["work", "urgent"])
-        task_list.add("Meeting notes", tags=["meeting", "work"])
+        task_list = copy.deepcopy(_search_tasks_template)
+        mocks.storage.return_value.load.return_value = task_list
         return task_list
 
-    @pytest.fixture
-    def temp_config(self, tmp_path: Path) -> dict:
-        """Create a temporary config for testing."""
-        return {
-            "data_dir": tmp_path,
-            "color_enabled": False,
-        }
-
-    @patch("todo_cli.commands.search.ConfigLoader")
-    @patch("todo_cli.commands.search.StorageManager")
-    @patch("todo_cli.commands.search.DisplayFormatter")
-    def test_search_by_keyword(
-        self, mock_formatter, mock_storage, mock_config_loader, task_list, temp_config
-    ) -> None:
+    def test_search_by_keyword(self, mocks: SimpleNamespace, task_list: TaskList) -> None:
         """Test searching by keyword."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list
-
-        search_tasks("bill")
+        search_tasks("bill", tag=None, project=None)
 
         # Verify search was performed
-        call_args = mock_formatter.return_value.format_task_table.call_args
+        call_args = mocks.formatter.return_value.format_task_table.call_args
         displayed_tasks = call_args[0][0]
         assert len(displayed_tasks) == 1
         assert "Electricity" in displayed_tasks[0].title
 
-    @patch("todo_cli.commands.search.ConfigLoader")
-    @patch("todo_cli.commands.search.StorageManager")
-    @patch("todo_cli.commands.search.DisplayFormatter")
-    def test_search_by_tag(
-        self, mock_formatter, mock_storage, mock_config_loader, task_list, temp_config
-    ) -> None:
+    def test_search_by_tag(self, mocks: SimpleNamespace, task_list: TaskList) -> None:
         """Test searching by tag."""
-        mock_config_loader.return_value.load.return_value = temp_config
-        mock_storage.return_value.load.return_value = task_list
-
-        search_tasks(tag="work")
+        search_tasks(None, tag="work", project=None)
 
         # Verify search was performed
-        call_args = mock_formatter.return_value.format_task_table.call_args
+        call_args = mocks.formatter.return_value.format_task_table.call_args
         displayed_tasks = call_args[0][0]
         assert len(displayed_tasks) == 2
         assert all("work" in t.tags for t in displayed_tasks)
+
+
+class TestAppContext:
+    """Tests for the shared command context."""
+
+    def test_collaborators_are_built_once(
+        self, mocker: MockerFixture, temp_config: Config, collaborators: Dict[str, MagicMock]
+    ) -> None:
+        """Test the context builds each collaborator lazily and reuses it."""
+        mocks = _patch_command(mocker, temp_config, collaborators, undo=True)
+        app_ctx = context.AppContext()
+
+        assert app_ctx.storage is app_ctx.storage
+        assert app_ctx.formatter is app_ctx.formatter
+        mocks.config.assert_called_once()
+        mocks.storage.assert_called_once_with(temp_config.data_dir / "tasks.json")
+        mocks.undo.assert_not_called()
+
+    def test_installed_context_is_shared(self, mocker: MockerFixture, temp_config: Config) -> None:
+        """Test commands receive the context installed by the root callback."""
+        mocker.patch.object(context, "_CURRENT", context.ContextVar("app_context", default=None))
+        app_ctx = context.AppContext(temp_config)
+        context.set_app_context(app_ctx)
+
+        assert context.get_app_context() is app_ctx
+
+
+class TestStatusMessages:
+    """Tests for the formatter's one-line status messages."""
+
+    @pytest.mark.parametrize("terminal", [True, False])
+    def test_markup_in_message_is_printed_verbatim(
+        self, mocker: MockerFixture, temp_config: Config, terminal: bool
+    ) -> None:
+        """Test the raw ANSI and Rich paths print the same text for bracketed messages."""
+        out = io.StringIO()
+        console = Console(file=out, force_terminal=terminal, color_system="standard")
+        mocker.patch.object(formatter, "_get_console", return_value=console)
+        display = DisplayFormatter(temp_config)
+        assert display._raw_ansi is terminal
+
+        display.print_success("Added [bold]task[/bold] [i]")
+
+        text = re.sub(r"\x1b\[[0-9;]*m", "", out.getvalue())
+        assert text == f"{DisplayFormatter.SUCCESS_ICON} Added [bold]task[/bold] [i]\n"
+
+
+class TestTaskTable:
+    """Tests for paging long task tables."""
+
+    @pytest.mark.parametrize("less, styles", [("-R", True), ("-FX", False), (None, False)])
+    def test_pager_keeps_styles_only_for_raw_less(
+        self,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        temp_config: Config,
+        less: str,
+        styles: bool,
+    ) -> None:
+        """Test long listings are paged with colors only when LESS passes escapes through."""
+        if less is None:
+            monkeypatch.delenv("LESS", raising=False)
+        else:
+            monkeypatch.setenv("LESS", less)
+        console = Console(file=io.StringIO(), force_terminal=True, color_system="standard")
+        pager = mocker.patch.object(console, "pager")
+        mocker.patch.object(formatter, "_get_console", return_value=console)
+
+        tasks = [Task(id=i, title=f"Task {i}") for i in range(1, formatter._PAGER_THRESHOLD + 2)]
+        DisplayFormatter(temp_config).format_task_table(tasks)
+
+        pager.assert_called_once_with(styles=styles)
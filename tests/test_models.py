@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime
+from typing import Callable, List
 
 from todo_cli.models.task import Task, TaskPriority, TaskStatus
 from todo_cli.models.task_list import TaskList
@@ -38,23 +39,39 @@ class TestTask:
         assert task.project == "My Project"
         assert task.due_date == datetime(2026, 1, 15)
 
-    def test_is_overdue_with_past_date(self) -> None:
+    def test_is_overdue_with_past_date(self, frozen_now: datetime) -> None:
         """Test overdue detection with past date."""
         past_date = datetime(2020, 1, 1)
         task = Task(id=1, title="Overdue task", due_date=past_date)
         assert task.is_overdue() is True
 
-    def test_is_overdue_with_future_date(self) -> None:
+    def test_is_overdue_with_future_date(self, frozen_now: datetime) -> None:
         """Test overdue detection with future date."""
         future_date = datetime(2030, 1, 1)
         task = Task(id=1, title="Future task", due_date=future_date)
         assert task.is_overdue() is False
 
+    def test_is_overdue_with_explicit_now(self, frozen_now: datetime) -> None:
+        """Test a passed reference time takes precedence over the clock."""
+        task = Task(id=1, title="Due task", due_date=datetime(2024, 6, 1))
+        assert task.is_overdue() is True
+        assert task.is_overdue(now=datetime(2024, 1, 1)) is False
+
     def test_is_overdue_without_due_date(self) -> None:
         """Test overdue detection without due date."""
         task = Task(id=1, title="No date task")
         assert task.is_overdue() is False
 
+    def test_format_due_tracks_changes(self) -> None:
+        """Test the memoized due string follows due date and format changes."""
+        task = Task(id=1, title="Due task", due_date=datetime(2026, 1, 15))
+        assert task.format_due("%Y-%m-%d") == "2026-01-15"
+        assert task.format_due("%d/%m/%Y") == "15/01/2026"
+
+        task.due_date = datetime(2026, 2, 1)
+        assert task.format_due("%d/%m/%Y") == "01/02/2026"
+        assert "_due_fmt" not in task.to_dict()
+
     def test_serialization(self) -> None:
         """Test task serialization to dictionary."""
         task = Task(
@@ -109,6 +126,42 @@ class TestTask:
 class TestTaskList:
     """Tests for TaskList model."""
 
+    @pytest.fixture(scope="module")
+    def rich_task_list(self, make_task_list: Callable[..., TaskList]) -> TaskList:
+        """Create one task list covering every filter criterion."""
+        return make_task_list(
+            {
+                "title": "Electricity bill",
+                "priority": TaskPriority.HIGH,
+                "tags": ["work", "urgent"],
+                "project": "Project A",
+                "due_date": datetime(2020, 1, 1),
+            },
+            {
+                "title": "Water bill",
+                "status": TaskStatus.COMPLETED,
+                "priority": TaskPriority.LOW,
+                "tags": ["personal"],
+                "project": "Project B",
+                "due_date": datetime(2030, 1, 1),
+            },
+            {"title": "Buy groceries", "tags": ["personal"]},
+            {
+                "title": "Code review",
+                "priority": TaskPriority.HIGH,
+                "tags": ["work"],
+                "project": "Project A",
+                "due_date": datetime(2030, 1, 1),
+            },
+            {
+                "title": "Call plumber",
+                "status": TaskStatus.COMPLETED,
+                "priority": TaskPriority.LOW,
+                "due_date": datetime(2020, 1, 1),
+            },
+            {"title": "Team meeting", "tags": ["meeting"], "project": "Project B"},
+        )
+
     def test_add_task(self) -> None:
         """Test adding a task."""
         task_list = TaskList()
@@ -126,6 +179,19 @@ class TestTaskList:
         assert found_task is added_task
         assert found_task.id == 1
 
+    def test_get_by_id_after_delete_and_renumber(self) -> None:
+        """Test the id index follows delete and id updates."""
+        task_list = TaskList()
+        task_list.add("Task 1")
+        task_list.add("Task 2")
+        task_list.delete(1)
+        task_list.update(2, id=7)
+
+        assert task_list.get_by_id(1) is None
+        assert task_list.get_by_id(2) is None
+        assert task_list.get_by_id(7).title == "Task 2"
+        assert TaskList.from_dict(task_list.to_dict()).get_by_id(7).title == "Task 2"
+
     def test_get_by_id_not_found(self) -> None:
         """Test retrieving non-existent task."""
         task_list = TaskList()
@@ -156,71 +222,44 @@ class TestTaskList:
         pending_task = task_list.mark_pending(1)
         assert pending_task.status == TaskStatus.PENDING
 
-    def test_filter_by_status(self) -> None:
-        """Test filtering tasks by status."""
-        task_list = TaskList()
-        task_list.add("Pending task", priority=TaskPriority.HIGH)
-        task_list.add("Completed task", priority=TaskPriority.LOW, status=TaskStatus.COMPLETED)
-        task_list.add("Another pending", priority=TaskPriority.MEDIUM)
-
-        pending_tasks = task_list.filter(status=TaskStatus.PENDING)
-        assert len(pending_tasks) == 2
-
-        completed_tasks = task_list.filter(status=TaskStatus.COMPLETED)
-        assert len(completed_tasks) == 1
-
-    def test_filter_by_priority(self) -> None:
-        """Test filtering tasks by priority."""
-        task_list = TaskList()
-        task_list.add("High priority", priority=TaskPriority.HIGH)
-        task_list.add("Low priority", priority=TaskPriority.LOW)
-        task_list.add("Medium priority", priority=TaskPriority.MEDIUM)
-
-        high_priority = task_list.filter(priority=TaskPriority.HIGH)
-        assert len(high_priority) == 1
-        assert high_priority[0].title == "High priority"
-
-    def test_filter_by_tag(self) -> None:
-        """Test filtering tasks by tag."""
-        task_list = TaskList()
-        task_list.add("Work task", tags=["work", "urgent"])
-        task_list.add("Personal task", tags=["personal"])
-        task_list.add("Another work task", tags=["work"])
-
-        work_tasks = task_list.filter(tag="work")
-        assert len(work_tasks) == 2
-
-    def test_filter_by_project(self) -> None:
-        """Test filtering tasks by project."""
-        task_list = TaskList()
-        task_list.add("Project A task", project="Project A")
-        task_list.add("Project B task", project="Project B")
-        task_list.add("No project task")
-
-        project_a_tasks = task_list.filter(project="Project A")
-        assert len(project_a_tasks) == 1
-        assert project_a_tasks[0].project == "Project A"
-
-    def test_filter_overdue(self) -> None:
-        """Test filtering overdue tasks."""
-        task_list = TaskList()
-        task_list.add("Overdue task", due_date=datetime(2020, 1, 1))
-        task_list.add("Future task", due_date=datetime(2030, 1, 1))
-        task_list.add("No date task")
-
-        overdue_tasks = task_list.filter(overdue_only=True)
-        assert len(overdue_tasks) == 1
-        assert overdue_tasks[0].title == "Overdue task"
-
-    def test_filter_by_keyword(self) -> None:
-        """Test filtering tasks by keyword."""
-        task_list = TaskList()
-        task_list.add("Electricity bill")
-        task_list.add("Water bill")
-        task_list.add("Buy groceries")
-
-        matching_tasks = task_list.filter(keyword="bill")
-        assert len(matching_tasks) == 2
+    @pytest.mark.parametrize(
+        "kwargs,expected_titles",
+        [
+            (
+                {"status": TaskStatus.PENDING},
+                ["Electricity bill", "Buy groceries", "Code review", "Team meeting"],
+            ),
+            ({"status": TaskStatus.COMPLETED}, ["Water bill", "Call plumber"]),
+            ({"priority": TaskPriority.HIGH}, ["Electricity bill", "Code review"]),
+            ({"tag": "work"}, ["Electricity bill", "Code review"]),
+            ({"project": "Project A"}, ["Electricity bill", "Code review"]),
+            ({"overdue_only": True}, ["Electricity bill", "Call plumber"]),
+            ({"keyword": "bill"}, ["Electricity bill", "Water bill"]),
+            ({"keyword": "BILL", "status": TaskStatus.PENDING}, ["Electricity bill"]),
+            ({"tag": "work", "overdue_only": True, "project": "Project A"}, ["Electricity bill"]),
+        ],
+        ids=[
+            "status-pending",
+            "status-completed",
+            "priority",
+            "tag",
+            "project",
+            "overdue",
+            "keyword",
+            "keyword-and-status",
+            "tag-overdue-project",
+        ],
+    )
+    def test_filter(
+        self,
+        rich_task_list: TaskList,
+        frozen_now: datetime,
+        kwargs: dict,
+        expected_titles: List[str],
+    ) -> None:
+        """Test filtering tasks by each supported criterion."""
+        filtered = rich_task_list.filter(**kwargs)
+        assert [t.title for t in filtered] == expected_titles
 
     def test_sort_by_priority(self) -> None:
         """Test sorting tasks by priority."""
@@ -246,6 +285,23 @@ class TestTaskList:
         assert sorted_tasks[1].title == "Task A"
         assert sorted_tasks[2].title == "Task B"
 
+    def test_sort_with_limit(self) -> None:
+        """Test limited sort returns the head of the full sort order."""
+        task_list = TaskList()
+        task_list.add("Task A", due_date=datetime(2026, 1, 15))
+        task_list.add("Task B", due_date=datetime(2026, 1, 20))
+        task_list.add("Task C", due_date=datetime(2026, 1, 10))
+
+        assert [t.title for t in task_list.sort(by="due_date", limit=2)] == ["Task C", "Task A"]
+        assert [t.title for t in task_list.sort(by="due_date", reverse=True, limit=1)] == ["Task B"]
+
+    def test_stats_and_filter(self, rich_task_list: TaskList, frozen_now: datetime) -> None:
+        """Test single-pass filtering matches filter() and counts the whole list."""
+        filtered, total, completed, pending, overdue = rich_task_list.stats_and_filter(tag="work")
+
+        assert filtered == rich_task_list.filter(tag="work")
+        assert (total, completed, pending, overdue) == (6, 2, 4, 2)
+
     def test_count_by_status(self) -> None:
         """Test counting tasks by status."""
         task_list = TaskList()
@@ -256,6 +312,19 @@ class TestTaskList:
         assert task_list.count() == 3
         assert task_list.count(status=TaskStatus.PENDING) == 2
         assert task_list.count(status=TaskStatus.COMPLETED) == 1
+        assert task_list.status_counts() == (3, 1, 2)
+
+    def test_count_by_status_value(self) -> None:
+        """Test count accepts plain status strings as well as enum members."""
+        task_list = TaskList()
+        task_list.add("Task 1")
+        task_list.add("Task 2")
+        task_list.add("Task 3")
+        task_list.mark_completed(1)
+
+        assert task_list.count(status="completed") == 1
+        assert task_list.count(status="pending") == 2
+        assert task_list.count(status="archived") == 0
 
     def test_serialization(self) -> None:
         """Test TaskList serialization."""
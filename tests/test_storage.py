@@ -1,6 +1,10 @@
 """Unit tests for storage modules."""
 
+import hashlib
 import json
+import os
+import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -10,7 +14,7 @@ import tempfile
 
 from todo_cli.models.task import Task, TaskPriority, TaskStatus
 from todo_cli.models.task_list import TaskList
-from todo_cli.storage.config_loader import Config, ConfigError, ConfigLoader
+from todo_cli.storage.config_loader import Config, ConfigError, ConfigLoader, get_config
 from todo_cli.storage.storage_manager import StorageError, StorageManager
 
 
@@ -66,6 +70,95 @@ class TestStorageManager:
         assert "last_modified" in data
         assert data["next_id"] == 1
 
+    def test_saved_tasks_match_task_to_dict(self, temp_dir: Path) -> None:
+        """Test the written tasks use the same layout as Task.to_dict."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=False)
+
+        task_list = TaskList()
+        task = task_list.add("Due task", priority="high", due_date=datetime(2026, 3, 1, 8, 30))
+        task.format_due("%Y-%m-%d")  # Memoized display state must not leak into the file
+        storage.save(task_list)
+
+        data = json.loads(tasks_file.read_text(encoding="utf-8"))
+        assert data["tasks"] == [task.to_dict()]
+
+    def test_stdlib_fallback_writes_same_layout(self, temp_dir: Path) -> None:
+        """Test saving without orjson produces the same task layout and metadata."""
+        tasks_file = temp_dir / "tasks.json"
+        task_list = TaskList()
+        task = task_list.add("Fallback task", due_date=datetime(2026, 3, 1, 8, 30))
+
+        with patch("todo_cli.storage.storage_manager.orjson", None):
+            StorageManager(tasks_file, create_backup=False).save(task_list)
+
+        data = json.loads(tasks_file.read_text(encoding="utf-8"))
+        assert data["tasks"] == [task.to_dict()]
+        datetime.fromisoformat(data["last_modified"])
+
+    def test_msgpack_round_trip(self, temp_dir: Path) -> None:
+        """Test a .msgpack tasks file is written as msgpack and loads back."""
+        ormsgpack = pytest.importorskip("ormsgpack")
+        tasks_file = temp_dir / "tasks.msgpack"
+        storage = StorageManager(tasks_file, create_backup=False)
+
+        task_list = TaskList()
+        task_list.add("Packed task", priority="high", tags=["work"])
+        storage.save(task_list)
+
+        assert ormsgpack.unpackb(tasks_file.read_bytes())["next_id"] == 2
+        loaded = StorageManager(tasks_file, create_backup=False).load()
+        assert loaded.to_dict() == task_list.to_dict()
+
+    def test_optional_codecs_are_imported_on_first_use(self) -> None:
+        """Test importing the storage manager doesn't load the msgpack, zstd or msgspec codecs."""
+        code = (
+            "import sys, todo_cli.storage.storage_manager; "
+            "sys.exit(any(m in sys.modules for m in ('ormsgpack', 'zstandard', 'msgspec')))"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_msgspec_load_matches_from_dict(self, temp_dir: Path) -> None:
+        """Test the typed msgspec decoder and the from_dict fallback agree."""
+        pytest.importorskip("msgspec")
+        tasks_file = temp_dir / "tasks.json"
+        tasks_file.write_text(
+            json.dumps(
+                {
+                    "tasks": [
+                        {
+                            "id": 1,
+                            "title": "Typed",
+                            "status": "completed",
+                            "priority": "high",
+                            "tags": ["work"],
+                            "project": None,
+                            "created_at": "2026-01-01T09:00:00",
+                            "due_date": None,
+                        },
+                        {
+                            "id": 2,
+                            "title": "Loose date",
+                            "status": "pending",
+                            "priority": "low",
+                            "tags": [],
+                            "project": None,
+                            "created_at": "2026-01-01 09:00:00",  # Not RFC 3339
+                            "due_date": None,
+                        },
+                    ],
+                    "next_id": 3,
+                    "version": "1.0.0",
+                }
+            )
+        )
+        expected = TaskList.from_dict(json.loads(tasks_file.read_text()))
+
+        loaded = StorageManager(tasks_file, create_backup=False).load()
+
+        assert loaded.to_dict() == expected.to_dict()
+        assert loaded.get_by_id(1).status is TaskStatus.COMPLETED
+
     def test_atomic_write(self, temp_dir: Path) -> None:
         """Test that writes are atomic (temporary file + rename)."""
         tasks_file = temp_dir / "tasks.json"
@@ -78,6 +171,90 @@ class TestStorageManager:
         # Verify file was written
         assert tasks_file.exists()
 
+    def test_paranoid_save_verifies_and_leaves_no_temp_files(self, temp_dir: Path) -> None:
+        """Test verified writes round-trip and clean up their temporary file."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=False, paranoid=True)
+
+        task_list = TaskList()
+        task_list.add("Verified task")
+        storage.save(task_list)
+
+        assert storage.load().tasks[0].title == "Verified task"
+        assert list(temp_dir.glob("*.tmp")) == []
+
+    def test_fsync_only_when_durable(self, temp_dir: Path) -> None:
+        """Test saves only fsync the file and directory when durability is requested."""
+        task_list = TaskList()
+        task_list.add("Synced task")
+
+        with patch("todo_cli.storage.storage_manager.os.fsync") as fsync:
+            StorageManager(temp_dir / "fast.json", create_backup=False).save(task_list)
+            assert fsync.call_count == 0
+
+            StorageManager(temp_dir / "safe.json", create_backup=False, durable=True).save(
+                task_list
+            )
+            assert fsync.call_count == (2 if hasattr(os, "O_DIRECTORY") else 1)
+
+    def test_save_skips_unchanged_task_list(self, temp_dir: Path) -> None:
+        """Test saving an unchanged task list doesn't rewrite the file."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=True)
+
+        task_list = TaskList()
+        task_list.add("Test task")
+        storage.save(task_list)
+        written = tasks_file.read_bytes()
+
+        storage.save(storage.load())
+
+        assert tasks_file.read_bytes() == written
+        assert list((temp_dir / "backups").iterdir()) == []
+
+    @pytest.mark.parametrize("name", ["tasks.json", "tasks.msgpack"])
+    def test_unchanged_save_from_fresh_manager_is_skipped(self, temp_dir: Path, name: str) -> None:
+        """Test a load-then-save in a new process leaves mtime and backups untouched."""
+        if name.endswith(".msgpack"):
+            pytest.importorskip("ormsgpack")
+        tasks_file = temp_dir / name
+        task_list = TaskList()
+        task_list.add("Test task", tags=["work"])
+        StorageManager(tasks_file, create_backup=True).save(task_list)
+        mtime = tasks_file.stat().st_mtime_ns
+        StorageManager._cache.clear()  # As in a fresh CLI process
+
+        storage = StorageManager(tasks_file, create_backup=True)
+        storage.save(storage.load())
+
+        assert tasks_file.stat().st_mtime_ns == mtime
+        assert list((temp_dir / "backups").iterdir()) == []
+
+    def test_read_only_load_never_serializes(self, temp_dir: Path) -> None:
+        """Test loading doesn't re-encode the tasks to compute a digest."""
+        tasks_file = temp_dir / "tasks.json"
+        task_list = TaskList()
+        task_list.add("Test task")
+        StorageManager(tasks_file, create_backup=False).save(task_list)
+        StorageManager._cache.clear()
+
+        with patch("todo_cli.storage.storage_manager._dumps") as dumps:
+            StorageManager(tasks_file, create_backup=False).load()
+
+        dumps.assert_not_called()
+
+    def test_save_force_rewrites_unchanged_task_list(self, temp_dir: Path) -> None:
+        """Test force=True writes even when nothing changed."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=True)
+
+        task_list = TaskList()
+        task_list.add("Test task")
+        storage.save(task_list)
+        storage.save(task_list, force=True)
+
+        assert len(list((temp_dir / "backups").iterdir())) == 1
+
     def test_backup_created(self, temp_dir: Path) -> None:
         """Test that backups are created."""
         tasks_file = temp_dir / "tasks.json"
@@ -96,6 +273,74 @@ class TestStorageManager:
         backups = list((temp_dir / "backups").glob(f"{tasks_file.name}.*"))
         assert len(backups) > 0
 
+    def test_backups_are_pruned_to_ten(self, temp_dir: Path) -> None:
+        """Test old backups are removed so at most ten remain."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=True)
+        for i in range(12):
+            (storage.backup_dir / f"tasks.json.2025-01-{i + 1:02d}_00-00-00").write_text("{}")
+
+        task_list = TaskList()
+        task_list.add("Task")
+        storage.save(task_list, force=True)
+        storage.save(task_list, force=True)
+
+        backups = storage.list_backups()
+        assert len(backups) == 10
+        assert "2025-01-01_00-00-00" not in backups
+
+    def test_backup_keeps_previous_contents(self, temp_dir: Path) -> None:
+        """Test a backup holds the file as it was before the save that made it."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=True)
+        task_list = TaskList()
+        task_list.add("Original task")
+        storage.save(task_list)
+        original = tasks_file.read_bytes()
+
+        task_list.tasks[0].title = "Modified task"
+        storage.save(task_list)
+
+        (backup,) = storage.backup_dir.iterdir()
+        assert backup.read_bytes() == original
+        assert tasks_file.read_bytes() != original
+
+    def test_older_backups_are_compressed(self, temp_dir: Path) -> None:
+        """Test all but the newest backup are zstd-compressed and still restore."""
+        pytest.importorskip("zstandard")
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=True)
+        old_contents = b'{"tasks": [], "next_id": 7}'
+        (storage.backup_dir / "tasks.json.2025-01-01_00-00-00").write_bytes(old_contents)
+        tasks_file.write_bytes(b'{"tasks": [], "next_id": 1}')
+
+        task_list = TaskList()
+        task_list.add("Task")
+        storage.save(task_list, force=True)
+
+        names = sorted(p.name for p in storage.backup_dir.iterdir())
+        assert names[0] == "tasks.json.2025-01-01_00-00-00.zst"
+        assert not names[1].endswith(".zst")
+        assert storage.list_backups()[0] == "2025-01-01_00-00-00"
+
+        storage.restore_backup("2025-01-01_00-00-00")
+        assert tasks_file.read_bytes() == old_contents
+
+    def test_backup_directory_scanned_once(self, temp_dir: Path) -> None:
+        """Test repeated saves and listings reuse the first backup directory scan."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=True)
+        task_list = TaskList()
+        task_list.add("Task")
+
+        with patch("todo_cli.storage.storage_manager.os.scandir", wraps=os.scandir) as scandir:
+            for _ in range(3):
+                storage.save(task_list, force=True)
+            backups = storage.list_backups()
+
+        assert scandir.call_count == 1
+        assert len(backups) == len(list(storage.backup_dir.iterdir()))
+
     def test_restore_backup(self, temp_dir: Path) -> None:
         """Test restoring from backup."""
         tasks_file = temp_dir / "tasks.json"
@@ -121,6 +366,53 @@ class TestStorageManager:
 
         assert restored_list.tasks[0].title == "Original task"
 
+    def test_load_returns_independent_copies(self, temp_dir: Path) -> None:
+        """Test repeated loads don't share mutable task lists."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=False)
+
+        task_list = TaskList()
+        task_list.add("Cached task")
+        storage.save(task_list)
+
+        first = storage.load()
+        first.tasks[0].title = "Mutated"
+        second = storage.load()
+        second.tasks[0].title = "Mutated again"
+        third = storage.load()
+
+        assert third.tasks[0].title == "Cached task"
+
+    def test_first_load_is_not_deep_copied(self, temp_dir: Path) -> None:
+        """Test a cold load returns the parsed list without a defensive deepcopy."""
+        tasks_file = temp_dir / "tasks.json"
+        task_list = TaskList()
+        task_list.add("Cold task")
+        StorageManager(tasks_file, create_backup=False).save(task_list)
+
+        with patch("todo_cli.storage.storage_manager.copy.deepcopy") as deepcopy:
+            loaded = StorageManager(tasks_file, create_backup=False).load()
+
+        deepcopy.assert_not_called()
+        assert loaded.tasks[0].title == "Cold task"
+
+    def test_load_sees_external_changes(self, temp_dir: Path) -> None:
+        """Test the load cache is invalidated when the file changes on disk."""
+        tasks_file = temp_dir / "tasks.json"
+        storage = StorageManager(tasks_file, create_backup=False)
+
+        task_list = TaskList()
+        task_list.add("Task 1")
+        storage.save(task_list)
+        assert len(storage.load().tasks) == 1
+
+        # Another process rewrites the file
+        task_list.add("Task 2")
+        other = StorageManager(tasks_file, create_backup=False)
+        other.save(task_list)
+
+        assert len(storage.load().tasks) == 2
+
     def test_load_corrupted_json(self, temp_dir: Path) -> None:
         """Test loading corrupted JSON raises error."""
         tasks_file = temp_dir / "tasks.json"
@@ -177,6 +469,13 @@ class TestConfigLoader:
         value = loader.get("default_priority")
         assert value == "high"
 
+    def test_get_formats_booleans_and_unset_values(self, temp_dir: Path) -> None:
+        """Test get renders booleans as true/false and falls back for unset keys."""
+        loader = ConfigLoader(temp_dir / "config.toml")
+
+        assert loader.get("color_enabled") == "true"
+        assert loader.get("editor", "vi") == "vi"
+
     def test_get_nonexistent_key_returns_default(self, temp_dir: Path) -> None:
         """Test getting non-existent key returns default."""
         config_file = temp_dir / "config.toml"
@@ -218,6 +517,165 @@ class TestConfigLoader:
         reloaded = loader.load()
         assert reloaded.color_enabled is False
 
+    def test_set_storage_format(self, temp_dir: Path) -> None:
+        """Test storage_format is validated and selects the tasks file."""
+        pytest.importorskip("ormsgpack")
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"data_dir = {json.dumps(str(temp_dir))}\n", encoding="utf-8")
+        loader = ConfigLoader(config_file)
+
+        loader.set("storage_format", "msgpack")
+        assert loader.load().tasks_file.name == "tasks.msgpack"
+        with pytest.raises(ConfigError):
+            loader.set("storage_format", "yaml")
+
+    def test_set_storage_format_converts_existing_tasks(self, temp_dir: Path) -> None:
+        """Test switching formats carries the tasks over instead of starting empty."""
+        pytest.importorskip("ormsgpack")
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"data_dir = {json.dumps(str(temp_dir))}\n", encoding="utf-8")
+        task_list = TaskList()
+        task_list.add("Keep me", priority="high")
+        StorageManager(temp_dir / "tasks.json", create_backup=False).save(task_list)
+
+        ConfigLoader(config_file).set("storage_format", "msgpack")
+
+        loaded = StorageManager(temp_dir / "tasks.msgpack", create_backup=False).load()
+        assert loaded.to_dict() == task_list.to_dict()
+        assert not (temp_dir / "tasks.json").exists()
+        assert (temp_dir / "tasks.json.migrated").exists()
+
+    def test_set_storage_format_keeps_every_migrated_file(self, temp_dir: Path) -> None:
+        """Test switching back and forth never overwrites an earlier .migrated file."""
+        pytest.importorskip("ormsgpack")
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"data_dir = {json.dumps(str(temp_dir))}\n", encoding="utf-8")
+        task_list = TaskList()
+        task_list.add("Round trip")
+        StorageManager(temp_dir / "tasks.json", create_backup=False).save(task_list)
+
+        for storage_format in ("msgpack", "json", "msgpack"):
+            ConfigLoader(config_file).set("storage_format", storage_format)
+
+        assert (temp_dir / "tasks.json.migrated").exists()
+        assert (temp_dir / "tasks.json.migrated.1").exists()
+        assert (temp_dir / "tasks.msgpack.migrated").exists()
+
+    def test_set_storage_format_requires_msgpack_codec(self, temp_dir: Path) -> None:
+        """Test msgpack is refused up front when ormsgpack isn't installed."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"data_dir = {json.dumps(str(temp_dir))}\n", encoding="utf-8")
+
+        with patch.dict(sys.modules, {"ormsgpack": None}):
+            with pytest.raises(ConfigError, match="ormsgpack"):
+                ConfigLoader(config_file).set("storage_format", "msgpack")
+
+        assert ConfigLoader(config_file).load().storage_format == "json"
+
+    def test_set_storage_format_refuses_to_overwrite(self, temp_dir: Path) -> None:
+        """Test switching is refused while a file in the other format already exists."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(f"data_dir = {json.dumps(str(temp_dir))}\n", encoding="utf-8")
+        task_list = TaskList()
+        task_list.add("Current")
+        StorageManager(temp_dir / "tasks.json", create_backup=False).save(task_list)
+        (temp_dir / "tasks.msgpack").write_bytes(b"stale")
+
+        with pytest.raises(ConfigError, match="already exists"):
+            ConfigLoader(config_file).set("storage_format", "msgpack")
+
+        assert ConfigLoader(config_file).load().storage_format == "json"
+        assert (temp_dir / "tasks.json").exists()
+
+    def test_loading_config_does_not_import_storage_codecs(self) -> None:
+        """Test importing the config loader leaves storage_manager unloaded."""
+        code = (
+            "import sys, todo_cli.storage.config_loader; "
+            "sys.exit('todo_cli.storage.storage_manager' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_set_rewrites_only_target_line(self, temp_dir: Path) -> None:
+        """Test set keeps comments and tables and edits just the one key."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(
+            '# my settings\nsort_by = "priority"\n\n[aliases]\nls = "list"\n',
+            encoding="utf-8",
+        )
+        loader = ConfigLoader(config_file)
+
+        loader.set("sort_by", "due_date")
+        loader.set("editor", "vim")
+
+        text = config_file.read_text(encoding="utf-8")
+        assert text.startswith("# my settings\n")
+        assert text.index('editor = "vim"') < text.index("[aliases]")
+        reloaded = ConfigLoader(config_file).load()
+        assert reloaded.sort_by == "due_date"
+        assert reloaded.editor == "vim"
+        assert reloaded.aliases == {"ls": "list"}
+
+    def test_set_keeps_file_permissions(self, temp_dir: Path) -> None:
+        """Test the atomic rewrite keeps the config file's mode."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text('sort_by = "priority"\n', encoding="utf-8")
+        config_file.chmod(0o644)
+
+        ConfigLoader(config_file).set("sort_by", "title")
+
+        assert config_file.stat().st_mode & 0o777 == 0o644
+
+    def test_load_returns_private_copy_of_cached_config(self, temp_dir: Path) -> None:
+        """Test mutating a loaded config doesn't leak into later loads."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text('default_priority = "high"\n', encoding="utf-8")
+
+        first = ConfigLoader(config_file).load()
+        first.default_tags.append("leaked")
+        second = ConfigLoader(config_file).load()
+
+        assert second.default_priority == "high"
+        assert second.default_tags == []
+
+    def test_load_picks_up_changed_file(self, temp_dir: Path) -> None:
+        """Test the config cache is invalidated when the file changes."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text('default_priority = "high"\n', encoding="utf-8")
+        assert get_config(config_file).default_priority == "high"
+
+        config_file.write_text('default_priority = "low"\n', encoding="utf-8")
+        assert get_config(config_file).default_priority == "low"
+
+    def test_parse_cache_reused_only_while_contents_match(self, temp_dir: Path) -> None:
+        """Test the on-disk parse cache is used only for the contents it was made from."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text('sort_by = "title"\n', encoding="utf-8")
+        cache_file = temp_dir / "config.toml.cache"
+        digest = hashlib.blake2b(config_file.read_bytes(), digest_size=16).hexdigest()
+
+        # A cache entry tagged with the file's current digest is trusted as-is
+        cache_file.write_text(
+            json.dumps({"blake2b": digest, "data": {"sort_by": "id"}}), encoding="utf-8"
+        )
+        assert get_config(config_file).sort_by == "id"
+
+        # A same-size edit that keeps the mtime is still noticed and reparsed
+        stat = config_file.stat()
+        config_file.write_text('sort_by = "prio"\n', encoding="utf-8")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert get_config(config_file).sort_by == "prio"
+        assert json.loads(cache_file.read_text(encoding="utf-8"))["data"] == {"sort_by": "prio"}
+
+    def test_config_with_dates_is_not_parse_cached(self, temp_dir: Path) -> None:
+        """Test configs holding TOML dates skip the JSON parse cache instead of stringifying."""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(
+            'sort_by = "title"\n\n[extra]\nsince = 2026-01-01\n', encoding="utf-8"
+        )
+
+        assert get_config(config_file).sort_by == "title"
+        assert not (temp_dir / "config.toml.cache").exists()
+
     def test_set_invalid_key_raises_error(self, temp_dir: Path) -> None:
         """Test setting invalid key raises error."""
         config_file = temp_dir / "config.toml"
@@ -1,10 +1,21 @@
 """Unit tests for utility modules."""
 
 from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from todo_cli.utils.date_utils import format_date, get_days_until, is_overdue, parse_date
+from todo_cli.models.task import Task, TaskPriority, TaskStatus
+from todo_cli.utils import date_utils
+from todo_cli.utils.date_utils import (
+    format_date,
+    get_days_until,
+    is_overdue,
+    parse_date,
+    pin_now,
+)
+from todo_cli.utils.undo_manager import UndoManager, _load_line
 from todo_cli.utils.validators import (
     validate_priority,
     validate_project,
@@ -44,6 +55,11 @@ class TestDateUtils:
         result = parse_date("+7")
         assert result.date() == (datetime.now() + timedelta(days=7)).date()
 
+    def test_parse_date_full_date_skips_clock(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an absolute date is parsed without reading the clock."""
+        monkeypatch.setattr(date_utils, "_now", lambda: pytest.fail("clock was read"))
+        assert parse_date("2026-1-5") == datetime(2026, 1, 5)
+
     def test_parse_date_invalid(self) -> None:
         """Test parsing invalid date returns None."""
         result = parse_date("invalid-date")
@@ -84,12 +100,33 @@ class TestDateUtils:
         """Test days until with None."""
         assert get_days_until(None) is None
 
+    def test_explicit_now_is_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a caller-supplied reference time replaces the clock read."""
+        monkeypatch.setattr(date_utils, "_now", lambda: pytest.fail("clock was read"))
+        now = datetime(2026, 3, 1, 12, 0)
+        due = datetime(2026, 3, 4)
+
+        assert is_overdue(due, now) is False
+        assert is_overdue(due, now=datetime(2026, 3, 5)) is True
+        assert get_days_until(due, now) == 2
+
     def test_format_date(self) -> None:
         """Test date formatting."""
         date = datetime(2026, 1, 15, 10, 30)
         result = format_date(date, "%Y-%m-%d %H:%M")
         assert result == "2026-01-15 10:30"
 
+    def test_pin_now_fixes_clock_within_command(self) -> None:
+        """Test pinned commands see one instant and the pin is released after."""
+
+        @pin_now
+        def command() -> tuple:
+            return date_utils._now(), date_utils._now()
+
+        first, second = command()
+        assert first == second
+        assert date_utils._NOW.get() is None
+
 
 class TestValidators:
     """Tests for input validators."""
@@ -102,7 +139,7 @@ class TestValidators:
 
     def test_validate_priority_case_insensitive(self) -> None:
         """Test priority validation is case-insensitive."""
-        assert validate_priority("HIGH") == "high"
+        assert validate_priority("HIGH") is TaskPriority.HIGH
         assert validate_priority("Low") == "low"
         assert validate_priority("MEDIUM") == "medium"
 
@@ -118,7 +155,7 @@ class TestValidators:
 
     def test_validate_status_case_insensitive(self) -> None:
         """Test status validation is case-insensitive."""
-        assert validate_status("PENDING") == "pending"
+        assert validate_status("PENDING") is TaskStatus.PENDING
         assert validate_status("COMPLETED") == "completed"
 
     def test_validate_status_invalid(self) -> None:
@@ -146,6 +183,11 @@ class TestValidators:
         tags = validate_tags(["work", "URGENT", "work", "shopping"])
         assert tags == ["work", "urgent", "shopping"]  # work appears only once
 
+    def test_validate_tags_splits_commas(self) -> None:
+        """Test comma-separated entries are split into separate tags."""
+        tags = validate_tags(["work,URGENT", "shopping, work", ","])
+        assert tags == ["work", "urgent", "shopping"]
+
     def test_validate_project_valid(self) -> None:
         """Test validating valid project."""
         assert validate_project("My Project") == "My Project"
@@ -170,9 +212,134 @@ class TestValidators:
         assert validate_task_id(3, valid_ids) is True
         assert validate_task_id(5, valid_ids) is True
 
+    def test_validate_task_id_accepts_set(self) -> None:
+        """Test validating task IDs against a set."""
+        valid_ids = {1, 2, 3, 5}
+        assert validate_task_id(3, valid_ids) is True
+        assert validate_task_id(4, valid_ids) is False
+
     def test_validate_task_id_invalid(self) -> None:
         """Test validating invalid task IDs."""
         valid_ids = [1, 2, 3, 5]
         assert validate_task_id(4, valid_ids) is False
         assert validate_task_id(6, valid_ids) is False
         assert validate_task_id(0, valid_ids) is False
+
+
+class TestUndoManager:
+    """Tests for the undo history journal."""
+
+    def test_record_appends_one_line_per_action(self, tmp_path: Path) -> None:
+        """Test recording actions appends to the journal without rewriting it."""
+        history_file = tmp_path / "undo_history.jsonl"
+        manager = UndoManager(history_file)
+
+        manager.record_delete(Task(id=1, title="Deleted"))
+        manager.record_complete(Task(id=2, title="Completed"))
+
+        assert len(history_file.read_bytes().splitlines()) == 2
+
+    def test_history_survives_reload(self, tmp_path: Path) -> None:
+        """Test a fresh manager sees previously recorded actions in order."""
+        history_file = tmp_path / "undo_history.jsonl"
+        UndoManager(history_file).record_delete(Task(id=1, title="Deleted"))
+        UndoManager(history_file).record_edit(Task(id=2, title="Edited"), {"title": "Old"})
+
+        manager = UndoManager(history_file)
+        assert [a.action_type for a in manager.history] == ["delete", "edit"]
+        assert manager.get_last_action().diff == {"title": "Old"}
+
+    def test_undo_pops_and_persists(self, tmp_path: Path) -> None:
+        """Test undo removes the last action from the journal."""
+        history_file = tmp_path / "undo_history.jsonl"
+        manager = UndoManager(history_file)
+        manager.record_delete(Task(id=1, title="Deleted"))
+        manager.record_complete(Task(id=2, title="Completed", status=TaskStatus.COMPLETED))
+
+        action = manager.undo()
+
+        assert action.action_type == "complete"
+        assert [a.action_type for a in UndoManager(history_file).history] == ["delete"]
+
+    def test_malformed_line_is_skipped(self, tmp_path: Path) -> None:
+        """Test a torn journal line doesn't discard the rest of the history."""
+        history_file = tmp_path / "undo_history.jsonl"
+        UndoManager(history_file).record_delete(Task(id=1, title="Deleted"))
+        with open(history_file, "ab") as f:
+            f.write(b'{"action_type": "del')
+
+        assert len(UndoManager(history_file).history) == 1
+
+    def test_history_is_capped(self, tmp_path: Path) -> None:
+        """Test only the most recent actions are kept."""
+        history_file = tmp_path / "undo_history.jsonl"
+        manager = UndoManager(history_file)
+        for i in range(UndoManager.MAX_HISTORY * 2 + 1):
+            manager.record_delete(Task(id=i, title=f"Task {i}"))
+
+        reloaded = UndoManager(history_file)
+        assert len(reloaded.history) == UndoManager.MAX_HISTORY
+        assert reloaded.history[-1].task_id == UndoManager.MAX_HISTORY * 2
+        # Loading an oversized journal compacts it
+        assert len(history_file.read_bytes().splitlines()) == UndoManager.MAX_HISTORY
+
+    def test_load_parses_only_the_tail(self, tmp_path: Path) -> None:
+        """Test lines older than the history window are never parsed."""
+        history_file = tmp_path / "undo_history.jsonl"
+        manager = UndoManager(history_file)
+        for i in range(UndoManager.MAX_HISTORY + 10):
+            manager.record_delete(Task(id=i, title=f"Task {i}"))
+
+        with patch("todo_cli.utils.undo_manager._load_line", wraps=_load_line) as load_line:
+            history = UndoManager(history_file).history
+
+        assert load_line.call_count == UndoManager.MAX_HISTORY
+        assert history[0].task_id == 10
+
+    def test_loaded_history_evicts_oldest_on_record(self, tmp_path: Path) -> None:
+        """Test recording into a full in-memory history drops the oldest action."""
+        history_file = tmp_path / "undo_history.jsonl"
+        manager = UndoManager(history_file)
+        manager.history  # Load before recording so appends go to memory too
+        for i in range(UndoManager.MAX_HISTORY + 1):
+            manager.record_delete(Task(id=i, title=f"Task {i}"))
+
+        assert len(manager.history) == UndoManager.MAX_HISTORY
+        assert manager.history[0].task_id == 1
+
+    def test_edit_stores_only_changed_fields(self, tmp_path: Path) -> None:
+        """Test edits are journaled as a diff of the fields that really changed."""
+        history_file = tmp_path / "undo_history.jsonl"
+        task = Task(id=3, title="New", priority=TaskPriority.HIGH, due_date=datetime(2026, 2, 1))
+
+        UndoManager(history_file).record_edit(
+            task, {"title": "Old", "priority": TaskPriority.HIGH, "due_date": None}
+        )
+
+        action = UndoManager(history_file).get_last_action()
+        assert action.task_id == 3
+        assert action.diff == {"title": "Old", "due_date": None}
+
+    def test_batch_appends_once_on_exit(self, tmp_path: Path) -> None:
+        """Test actions recorded in a batch reach the journal together when it ends."""
+        history_file = tmp_path / "undo_history.jsonl"
+        manager = UndoManager(history_file)
+
+        with manager.batch():
+            for i in range(3):
+                manager.record_delete(Task(id=i, title=f"Task {i}"))
+            assert not history_file.exists()
+
+        assert len(history_file.read_bytes().splitlines()) == 3
+
+    def test_history_read_inside_batch_includes_buffered_actions(self, tmp_path: Path) -> None:
+        """Test reading or undoing inside a batch sees buffered actions exactly once."""
+        history_file = tmp_path / "undo_history.jsonl"
+        manager = UndoManager(history_file)
+
+        with manager.batch():
+            manager.record_delete(Task(id=1, title="First"))
+            manager.record_delete(Task(id=2, title="Second"))
+            assert manager.undo().task_id == 2
+
+        assert [a.task_id for a in UndoManager(history_file).history] == [1]
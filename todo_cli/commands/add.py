@@ -2,17 +2,14 @@
 
 import typer
 
-from todo_cli.display.formatter import DisplayFormatter
-from todo_cli.models.config import Config
-from todo_cli.models.task_list import TaskList
-from todo_cli.storage.config_loader import ConfigLoader
-from todo_cli.storage.storage_manager import StorageManager
-from todo_cli.utils.date_utils import parse_date
+from todo_cli.context import get_app_context
+from todo_cli.utils.date_utils import parse_date, pin_now
 from todo_cli.utils.validators import validate_priority, validate_tags
 
 app = typer.Typer()
 
 
+@pin_now
 def add_task(
     title: str = typer.Argument(..., help="Task description"),
     priority: str = typer.Option("medium", "--priority", "-p", help="Priority level (low, medium, high)"),
@@ -29,27 +26,22 @@ def add_task(
         todo add "Submit report" --project work --due tomorrow
     """
     # Load configuration and tasks
-    config_loader = ConfigLoader()
-    config = config_loader.load()
+    app_ctx = get_app_context()
+    config = app_ctx.config
 
-    storage = StorageManager(config.data_dir / "tasks.json")
+    storage = app_ctx.storage
     task_list = storage.load()
 
-    formatter = DisplayFormatter(config)
+    formatter = app_ctx.formatter
 
-    # Validate priority
-    if not validate_priority(priority):
+    # Validate priority, resolving it to the enum member in the same step
+    priority_level = validate_priority(priority)
+    if priority_level is None:
         formatter.print_error(f"Invalid priority: {priority}. Must be low, medium, or high.")
         raise typer.Exit(1)
 
-    # Parse tags (handle comma-separated)
-    all_tags = []
-    for t in tag:
-        if "," in t:
-            all_tags.extend(t.split(","))
-        else:
-            all_tags.append(t)
-    validated_tags = validate_tags(all_tags)
+    # Parse tags (handles comma-separated values)
+    validated_tags = validate_tags(tag)
 
     # Parse due date
     due_date = None
@@ -67,7 +59,7 @@ def add_task(
     # Add task
     task = task_list.add(
         title,
-        priority=priority or config.default_priority,
+        priority=priority_level or config.default_priority,
         tags=validated_tags,
         project=project if project else None,
         due_date=due_date,
@@ -79,7 +71,7 @@ def add_task(
     # Display success
     formatter.print_success(f"Added task #{task.id}: {task.title}")
     if task.due_date:
-        formatter.print_info(f"Due: {task.due_date.strftime(config.date_format)}")
+        formatter.print_info(f"Due: {task.format_due(config.date_format)}")
     if task.tags:
         formatter.print_info(f"Tags: {', '.join(task.tags)}")
     if task.project:
@@ -1,13 +1,13 @@
 """Delete task command."""
 
+import sys
+
 import typer
 
-from todo_cli.display.formatter import DisplayFormatter
-from todo_cli.models.config import Config
-from todo_cli.models.task_list import TaskList
-from todo_cli.storage.config_loader import ConfigLoader
-from todo_cli.storage.storage_manager import StorageManager
-from todo_cli.utils.undo_manager import UndoManager
+from todo_cli.context import get_app_context
+
+# Whether a user can answer the confirmation prompt (checked once per process)
+_STDIN_IS_TTY = sys.stdin is not None and sys.stdin.isatty()
 
 
 def delete_task(
@@ -22,14 +22,12 @@ def delete_task(
         todo rm 3 --yes
     """
     # Load configuration and tasks
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    storage = StorageManager(config.data_dir / "tasks.json")
+    app_ctx = get_app_context()
+    storage = app_ctx.storage
     task_list = storage.load()
 
-    undo_manager = UndoManager(config.data_dir / "undo_history.json")
-    formatter = DisplayFormatter(config)
+    undo_manager = app_ctx.undo
+    formatter = app_ctx.formatter
 
     # Get task
     task = task_list.get_by_id(task_id)
@@ -40,8 +38,11 @@ def delete_task(
     # Show task details
     print(formatter.format_task(task, show_tags=True))
 
-    # Confirm deletion
+    # Confirm deletion (scripts must pass --yes explicitly)
     if not confirm:
+        if not _STDIN_IS_TTY:
+            formatter.print_error("Refusing to delete without --yes in non-interactive mode.")
+            raise typer.Exit(1)
         typer.confirm(f"Are you sure you want to delete task #{task_id}?", abort=True)
 
     # Delete task
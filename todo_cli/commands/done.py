@@ -2,12 +2,7 @@
 
 import typer
 
-from todo_cli.display.formatter import DisplayFormatter
-from todo_cli.models.config import Config
-from todo_cli.models.task_list import TaskList
-from todo_cli.storage.config_loader import ConfigLoader
-from todo_cli.storage.storage_manager import StorageManager
-from todo_cli.utils.undo_manager import UndoManager
+from todo_cli.context import get_app_context
 
 
 def mark_done(
@@ -21,14 +16,12 @@ def mark_done(
         todo complete 5
     """
     # Load configuration and tasks
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    storage = StorageManager(config.data_dir / "tasks.json")
+    app_ctx = get_app_context()
+    storage = app_ctx.storage
     task_list = storage.load()
 
-    undo_manager = UndoManager(config.data_dir / "undo_history.json")
-    formatter = DisplayFormatter(config)
+    undo_manager = app_ctx.undo
+    formatter = app_ctx.formatter
 
     # Get task
     task = task_list.get_by_id(task_id)
@@ -2,16 +2,12 @@
 
 import typer
 
-from todo_cli.display.formatter import DisplayFormatter
-from todo_cli.models.config import Config
-from todo_cli.models.task_list import TaskList
-from todo_cli.storage.config_loader import ConfigLoader
-from todo_cli.storage.storage_manager import StorageManager
-from todo_cli.utils.date_utils import parse_date
-from todo_cli.utils.undo_manager import UndoManager
+from todo_cli.context import get_app_context
+from todo_cli.utils.date_utils import parse_date, pin_now
 from todo_cli.utils.validators import validate_priority, validate_tags
 
 
+@pin_now
 def edit_task(
     task_id: int = typer.Argument(..., help="Task ID to edit"),
     title: str = typer.Option(None, "--title", help="New task title"),
@@ -31,14 +27,14 @@ def edit_task(
         todo edit 3  # Opens in $EDITOR
     """
     # Load configuration and tasks
-    config_loader = ConfigLoader()
-    config = config_loader.load()
+    app_ctx = get_app_context()
+    config = app_ctx.config
 
-    storage = StorageManager(config.data_dir / "tasks.json")
+    storage = app_ctx.storage
     task_list = storage.load()
 
-    undo_manager = UndoManager(config.data_dir / "undo_history.json")
-    formatter = DisplayFormatter(config)
+    undo_manager = app_ctx.undo
+    formatter = app_ctx.formatter
 
     # Get task
     task = task_list.get_by_id(task_id)
@@ -46,28 +42,20 @@ def edit_task(
         formatter.print_error(f"Task #{task_id} not found.")
         raise typer.Exit(1)
 
-    # Store previous state for undo
-    previous_state = task.to_dict().copy()
-
     # Apply updates
     updates: dict = {}
 
     if title:
         updates["title"] = title
     if priority:
-        if not validate_priority(priority):
+        priority_level = validate_priority(priority)
+        if priority_level is None:
             formatter.print_error(f"Invalid priority: {priority}. Must be low, medium, or high.")
             raise typer.Exit(1)
-        updates["priority"] = priority
+        updates["priority"] = priority_level
     if tag:
-        # Handle comma-separated tags
-        all_tags = []
-        for t in tag:
-            if "," in t:
-                all_tags.extend(t.split(","))
-            else:
-                all_tags.append(t)
-        updates["tags"] = validate_tags(all_tags)
+        # Handles comma-separated tags
+        updates["tags"] = validate_tags(tag)
     if project:
         updates["project"] = project if project else None
     if due:
@@ -81,6 +69,9 @@ def edit_task(
         formatter.print_info("No changes specified. Task remains unchanged.")
         raise typer.Exit(0)
 
+    # Store the previous values of just the changed fields for undo
+    previous_state = {key: getattr(task, key) for key in updates}
+
     # Update task
     updated_task = task_list.update(task_id, **updates)
 
@@ -94,7 +85,7 @@ def edit_task(
         formatter.print_success(f"Updated task #{task_id}")
         formatter.print_info(f"Title: {updated_task.title}")
         if updated_task.due_date:
-            formatter.print_info(f"Due: {updated_task.due_date.strftime(config.date_format)}")
+            formatter.print_info(f"Due: {updated_task.format_due(config.date_format)}")
         if updated_task.tags:
             formatter.print_info(f"Tags: {', '.join(updated_task.tags)}")
         if updated_task.project:
@@ -1,18 +1,13 @@
 """List tasks command."""
 
-from typing import List
-
 import typer
 
-from todo_cli.display.formatter import DisplayFormatter
-from todo_cli.models.config import Config
-from todo_cli.models.task import TaskPriority, TaskStatus
-from todo_cli.models.task_list import TaskList
-from todo_cli.storage.config_loader import ConfigLoader
-from todo_cli.storage.storage_manager import StorageManager
-from todo_cli.utils.validators import validate_priority
+from todo_cli.context import get_app_context
+from todo_cli.models.task import TaskStatus
+from todo_cli.utils.date_utils import pin_now
 
 
+@pin_now
 def list_tasks(
     all: bool = typer.Option(False, "--all", "-a", help="Show all tasks"),
     pending: bool = typer.Option(False, "--pending", "-p", help="Show pending tasks"),
@@ -22,6 +17,7 @@ def list_tasks(
     overdue: bool = typer.Option(False, "--overdue", help="Show only overdue tasks"),
     sort: str = typer.Option("priority", "--sort", help="Sort by: priority, due_date, created_at, title"),
     reverse: bool = typer.Option(False, "--reverse", "-r", help="Reverse sort order"),
+    limit: int = typer.Option(None, "--limit", "-n", help="Show at most N tasks"),
 ) -> None:
     """
     List tasks with optional filtering and sorting.
@@ -31,15 +27,16 @@ def list_tasks(
         todo ls --tag finance
         todo list --overdue --sort due_date
         todo list --project work --reverse
+        todo list --sort due_date --limit 5
     """
     # Load configuration and tasks
-    config_loader = ConfigLoader()
-    config = config_loader.load()
+    app_ctx = get_app_context()
+    config = app_ctx.config
 
-    storage = StorageManager(config.data_dir / "tasks.json")
+    storage = app_ctx.storage
     task_list = storage.load()
 
-    formatter = DisplayFormatter(config)
+    formatter = app_ctx.formatter
 
     # Determine filter criteria
     status_filter: TaskStatus | None = None
@@ -51,16 +48,18 @@ def list_tasks(
     elif not all and not config.show_completed:
         status_filter = TaskStatus.PENDING
 
-    # Filter tasks
-    filtered_tasks = task_list.filter(
-        status=status_filter,
-        tag=tag,
-        project=project,
-        overdue_only=overdue,
+    # Filter tasks and gather summary counts in one pass
+    filtered_tasks, total_count, completed_count, pending_count, overdue_count = (
+        task_list.stats_and_filter(
+            status=status_filter,
+            tag=tag,
+            project=project,
+            overdue_only=overdue,
+        )
     )
 
     # Sort tasks
-    sorted_tasks = task_list.sort(tasks=filtered_tasks, by=sort, reverse=reverse)
+    sorted_tasks = task_list.sort(tasks=filtered_tasks, by=sort, reverse=reverse, limit=limit)
 
     # Display
     title = "All Tasks"
@@ -78,9 +77,4 @@ def list_tasks(
     formatter.format_task_table(sorted_tasks, title=title)
 
     # Print summary
-    total_count = len(task_list.get_all())
-    completed_count = task_list.count(TaskStatus.COMPLETED)
-    pending_count = task_list.count(TaskStatus.PENDING)
-    overdue_count = len(task_list.filter(overdue_only=True))
-
     formatter.print_summary(total_count, completed_count, pending_count, overdue_count)
@@ -2,11 +2,7 @@
 
 import typer
 
-from todo_cli.display.formatter import DisplayFormatter
-from todo_cli.models.config import Config
-from todo_cli.models.task_list import TaskList
-from todo_cli.storage.config_loader import ConfigLoader
-from todo_cli.storage.storage_manager import StorageManager
+from todo_cli.context import get_app_context
 
 
 def search_tasks(
@@ -23,13 +19,11 @@ def search_tasks(
         todo search --project work "report"
     """
     # Load configuration and tasks
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-
-    storage = StorageManager(config.data_dir / "tasks.json")
+    app_ctx = get_app_context()
+    storage = app_ctx.storage
     task_list = storage.load()
 
-    formatter = DisplayFormatter(config)
+    formatter = app_ctx.formatter
 
     # Search/filter tasks
     filtered_tasks = task_list.filter(
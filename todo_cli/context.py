@@ -0,0 +1,94 @@
+"""Shared per-process application context for CLI commands."""
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
+
+from todo_cli.models.config import Config
+from todo_cli.storage.config_loader import get_config
+
+if TYPE_CHECKING:
+    from todo_cli.display.formatter import DisplayFormatter
+    from todo_cli.storage.storage_manager import StorageManager
+    from todo_cli.utils.undo_manager import UndoManager
+
+
+class AppContext:
+    """
+    Collaborators shared by every command run in one process.
+
+    Each collaborator is built on first access and then reused, so commands
+    only pay for what they touch and a long-lived session builds them once.
+    """
+
+    def __init__(self, config: Optional[Config] = None) -> None:
+        """
+        Initialize the context.
+
+        Args:
+            config: Config to use. Loaded from the user's config file on first access if omitted.
+        """
+        self._config = config
+        self._storage: Optional["StorageManager"] = None
+        self._formatter: Optional["DisplayFormatter"] = None
+        self._undo: Optional["UndoManager"] = None
+
+    @property
+    def config(self) -> Config:
+        """User configuration."""
+        if self._config is None:
+            self._config = get_config()
+        return self._config
+
+    @property
+    def storage(self) -> "StorageManager":
+        """Storage manager for the tasks file."""
+        if self._storage is None:
+            from todo_cli.storage.storage_manager import StorageManager
+
+            self._storage = StorageManager(self.config.tasks_file)
+        return self._storage
+
+    @property
+    def formatter(self) -> "DisplayFormatter":
+        """Display formatter configured for the current settings."""
+        if self._formatter is None:
+            from todo_cli.display.formatter import DisplayFormatter
+
+            self._formatter = DisplayFormatter(self.config)
+        return self._formatter
+
+    @property
+    def undo(self) -> "UndoManager":
+        """Undo manager backed by the history journal."""
+        if self._undo is None:
+            from todo_cli.utils.undo_manager import UndoManager
+
+            self._undo = UndoManager(self.config.undo_history_file)
+        return self._undo
+
+
+# Context installed by the CLI's root callback for the running invocation
+_CURRENT: ContextVar[Optional[AppContext]] = ContextVar("app_context", default=None)
+
+
+def set_app_context(app_ctx: AppContext) -> None:
+    """
+    Install the context that commands in this invocation will share.
+
+    Args:
+        app_ctx: Context to hand out from get_app_context().
+    """
+    _CURRENT.set(app_ctx)
+
+
+def get_app_context() -> AppContext:
+    """
+    Return the context of the running CLI invocation.
+
+    Falls back to a fresh context when a command is called outside the CLI
+    (e.g. directly from Python).
+
+    Returns:
+        AppContext for the current command.
+    """
+    return _CURRENT.get() or AppContext()
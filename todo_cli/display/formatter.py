@@ -1,16 +1,70 @@
 """Display formatter with Rich library for colorized output."""
 
+import functools
 import os
 import sys
 from datetime import datetime
 from typing import List, Optional
 
 from rich.console import Console
-from rich.table import Table
+from rich.markup import escape
 
+from todo_cli.models import task as task_module
 from todo_cli.models.config import Config
 from todo_cli.models.task import Task, TaskStatus
 
+_PRIORITY_COLORS = {
+    "high": "red",
+    "medium": "yellow",
+    "low": "green",
+}
+
+# Use ASCII-safe characters on Windows to avoid encoding issues
+if sys.platform == "win32":
+    _STATUS_ICONS = {
+        TaskStatus.COMPLETED: "[+]",
+        TaskStatus.PENDING: "[ ]",
+    }
+    _PRIORITY_ARROWS = {"high": "^", "medium": "->", "low": "v"}
+    _SUCCESS_ICON, _ERROR_ICON, _WARNING_ICON, _INFO_ICON = "[OK]", "[X]", "[!]", "[i]"
+else:
+    _STATUS_ICONS = {
+        TaskStatus.COMPLETED: "✓",
+        TaskStatus.PENDING: "○",
+    }
+    _PRIORITY_ARROWS = {"high": "↑", "medium": "→", "low": "↓"}
+    _SUCCESS_ICON, _ERROR_ICON, _WARNING_ICON, _INFO_ICON = "✓", "✗", "⚠", "ℹ"
+
+
+# Task tables longer than this are shown through the pager on a terminal
+_PAGER_THRESHOLD = 500
+
+# Bold ANSI colors for the single-line message fast path
+_ANSI_BOLD = {
+    "green": "\x1b[1;32m",
+    "red": "\x1b[1;31m",
+    "yellow": "\x1b[1;33m",
+    "blue": "\x1b[1;34m",
+}
+_ANSI_RESET = "\x1b[0m"
+
+
+@functools.lru_cache(maxsize=2)
+def _get_console(color: bool) -> Console:
+    """
+    Return the process-wide Console for a color setting.
+
+    Console construction probes the terminal (size, encoding, color support),
+    so formatters share one instance instead of building their own.
+
+    Args:
+        color: Whether color output is enabled.
+
+    Returns:
+        Shared Console instance.
+    """
+    return Console() if color else Console(no_color=True)
+
 
 class DisplayFormatter:
     """
@@ -19,33 +73,13 @@ class DisplayFormatter:
     Provides colorized, aligned, human-readable task displays.
     """
 
-    PRIORITY_COLORS = {
-        "high": "red",
-        "medium": "yellow",
-        "low": "green",
-    }
-
-    # Use ASCII-safe characters on Windows to avoid encoding issues
-    if sys.platform == "win32":
-        STATUS_ICONS = {
-            TaskStatus.COMPLETED: "[+]",
-            TaskStatus.PENDING: "[ ]",
-        }
-        PRIORITY_ARROWS = {"high": "^", "medium": "->", "low": "v"}
-        SUCCESS_ICON = "[OK]"
-        ERROR_ICON = "[X]"
-        WARNING_ICON = "[!]"
-        INFO_ICON = "[i]"
-    else:
-        STATUS_ICONS = {
-            TaskStatus.COMPLETED: "✓",
-            TaskStatus.PENDING: "○",
-        }
-        PRIORITY_ARROWS = {"high": "↑", "medium": "→", "low": "↓"}
-        SUCCESS_ICON = "✓"
-        ERROR_ICON = "✗"
-        WARNING_ICON = "⚠"
-        INFO_ICON = "ℹ"
+    PRIORITY_COLORS = _PRIORITY_COLORS
+    STATUS_ICONS = _STATUS_ICONS
+    PRIORITY_ARROWS = _PRIORITY_ARROWS
+    SUCCESS_ICON = _SUCCESS_ICON
+    ERROR_ICON = _ERROR_ICON
+    WARNING_ICON = _WARNING_ICON
+    INFO_ICON = _INFO_ICON
 
     def __init__(self, config: Config) -> None:
         """
@@ -55,7 +89,16 @@ class DisplayFormatter:
             config: Configuration object.
         """
         self.config = config
-        self.console = Console() if config.color_enabled else Console(no_color=True)
+        self.console = _get_console(config.color_enabled)
+
+        # Plain status lines on a color terminal can skip Rich's markup and render
+        # pipeline; legacy Windows consoles and no-color output still go through Rich
+        self._raw_ansi = bool(
+            self.console.is_terminal
+            and self.console.color_system
+            and not self.console.no_color
+            and not self.console.legacy_windows
+        )
 
     def format_task(
         self,
@@ -74,12 +117,13 @@ class DisplayFormatter:
         Returns:
             Formatted task string.
         """
-        status_icon = self.STATUS_ICONS[task.status]
+        status_icon = _STATUS_ICONS[task.status]
+        overdue = task.is_overdue()
 
         # Determine color based on status and overdue
         if task.status == TaskStatus.COMPLETED:
             color = "green"
-        elif task.is_overdue():
+        elif overdue:
             color = "red"
         else:
             color = "yellow"
@@ -95,13 +139,13 @@ class DisplayFormatter:
         parts.append(f"[{status_icon}] {title}")
 
         # Priority indicator
-        priority_emoji = self.PRIORITY_ARROWS[task.priority.value]
+        priority_emoji = _PRIORITY_ARROWS[task.priority.value]
         parts.append(f"[{priority_emoji}]")
 
         # Due date if present
         if task.due_date:
-            due_str = task.due_date.strftime(self.config.date_format)
-            due_color = "red" if task.is_overdue() else "blue"
+            due_str = task.format_due(self.config.date_format)
+            due_color = "red" if overdue else "blue"
             parts.append(f"Due: [{due_color}]{due_str}[/{due_color}]")
 
         # Project if present
@@ -135,34 +179,43 @@ class DisplayFormatter:
             self.print_info("No tasks found.")
             return
 
+        # Only listing commands render tables, so don't pay for rich.table elsewhere
+        from rich.table import Table
+
         table = Table(title=title, show_header=True, header_style="bold magenta")
 
+        # Fixed-width columns never need wrapping, which saves Rich a layout pass per cell
         if show_id:
-            table.add_column("ID", style="cyan", width=4)
-        table.add_column("Status", width=4)
+            table.add_column("ID", style="cyan", width=4, no_wrap=True)
+        table.add_column("Status", width=4, no_wrap=True)
         table.add_column("Title", style="bold white")
-        table.add_column("Priority", width=8)
-        table.add_column("Due", width=12)
+        table.add_column("Priority", width=8, no_wrap=True)
+        table.add_column("Due", width=12, no_wrap=True)
         table.add_column("Project", width=15)
         if show_tags:
             table.add_column("Tags", width=20)
 
+        # Read the clock and config once, and bind lookups to locals for the row loop
+        now = task_module._now()
+        date_format = self.config.date_format
+        status_icons = _STATUS_ICONS
+
         for task in tasks:
-            status_icon = self.STATUS_ICONS[task.status]
+            status_icon = status_icons[task.status]
 
             # Determine row color
-            if task.status == TaskStatus.COMPLETED:
+            if task.status is TaskStatus.COMPLETED:
                 row_style = "green"
-            elif task.is_overdue():
+            elif task.due_date is not None and now > task.due_date:
                 row_style = "red"
             else:
                 row_style = "yellow"
 
             # Due date
-            due_str = task.due_date.strftime(self.config.date_format) if task.due_date else ""
+            due_str = task.format_due(date_format)
 
             # Tags
-            tags_str = ", ".join(task.tags) if task.tags else ""
+            tags_str = ", ".join(task.tags)
 
             row: List[str] = []
             if show_id:
@@ -177,7 +230,13 @@ class DisplayFormatter:
 
             table.add_row(*row, style=row_style)
 
-        self.console.print(table)
+        # Page long listings on a terminal instead of scrolling thousands of rows past;
+        # keep colors only when less is set to pass raw escape codes through
+        if len(tasks) > _PAGER_THRESHOLD and self.console.is_terminal:
+            with self.console.pager(styles="R" in os.environ.get("LESS", "")):
+                self.console.print(table)
+        else:
+            self.console.print(table)
 
     def print_summary(self, total: int, completed: int, pending: int, overdue: int) -> None:
         """
@@ -199,16 +258,31 @@ class DisplayFormatter:
 
     def print_success(self, message: str) -> None:
         """Print success message in green."""
-        self.console.print(f"[bold green]{self.SUCCESS_ICON} {message}[/bold green]")
+        self._print_status("green", self.SUCCESS_ICON, message)
 
     def print_error(self, message: str) -> None:
         """Print error message in red."""
-        self.console.print(f"[bold red]{self.ERROR_ICON} {message}[/bold red]")
+        self._print_status("red", self.ERROR_ICON, message)
 
     def print_warning(self, message: str) -> None:
         """Print warning message in yellow."""
-        self.console.print(f"[bold yellow]{self.WARNING_ICON} {message}[/bold yellow]")
+        self._print_status("yellow", self.WARNING_ICON, message)
 
     def print_info(self, message: str) -> None:
         """Print info message in blue."""
-        self.console.print(f"[bold blue]{self.INFO_ICON} {message}[/bold blue]")
+        self._print_status("blue", self.INFO_ICON, message)
+
+    def _print_status(self, color: str, icon: str, message: str) -> None:
+        """
+        Print a bold, colored one-line status message.
+
+        Args:
+            color: Color name (green, red, yellow, blue).
+            icon: Leading status icon.
+            message: Message text.
+        """
+        if self._raw_ansi:
+            self.console.file.write(f"{_ANSI_BOLD[color]}{icon} {message}{_ANSI_RESET}\n")
+            self.console.file.flush()
+            return
+        self.console.print(f"[bold {color}]{escape(f'{icon} {message}')}[/bold {color}]")
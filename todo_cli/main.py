@@ -11,12 +11,8 @@ from todo_cli.commands.edit import edit_task
 from todo_cli.commands.list_cmd import list_tasks
 from todo_cli.commands.search import search_tasks
 from todo_cli.commands.undo import mark_undo
-from todo_cli.display.formatter import DisplayFormatter
-from todo_cli.models.config import Config
-from todo_cli.models.task_list import TaskList
+from todo_cli.context import AppContext, get_app_context, set_app_context
 from todo_cli.storage.config_loader import ConfigLoader
-from todo_cli.storage.storage_manager import StorageManager
-from todo_cli.utils.undo_manager import UndoManager
 
 # Create main Typer app
 app = typer.Typer(
@@ -27,6 +23,14 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def setup_context(ctx: typer.Context) -> None:
+    """A production-ready To-Do CLI application."""
+    # One shared context per invocation; collaborators are built on demand
+    ctx.obj = AppContext()
+    set_app_context(ctx.obj)
+
+
 # Register commands with aliases
 app.command(name="add")(add_task)
 app.command(name="new")(add_task)  # Alias
@@ -59,24 +63,25 @@ app.command(name="find")(search_tasks)  # Alias
 @app.command()
 def init() -> None:
     """Initialize the todo application (create data directory)."""
-    config_loader = ConfigLoader()
-    config = config_loader.load()
+    from todo_cli.models.task_list import TaskList
+
+    app_ctx = get_app_context()
+    config = app_ctx.config
 
     # Create data directory
     config.data_dir.mkdir(parents=True, exist_ok=True)
 
     # Create empty tasks file if it doesn't exist
-    tasks_file = config.data_dir / "tasks.json"
+    tasks_file = config.tasks_file
     if not tasks_file.exists():
-        storage = StorageManager(tasks_file)
-        storage.save(TaskList())
+        app_ctx.storage.save(TaskList())
 
     # Create config file if it doesn't exist
     config_file = config.data_dir / "config.toml"
     if not config_file.exists():
-        config_loader.save(config)
+        ConfigLoader().save(config)
 
-    formatter = DisplayFormatter(config)
+    formatter = app_ctx.formatter
     formatter.print_success(f"Initialized todo data directory: {config.data_dir}")
     formatter.print_info(f"Config file: {config_file}")
     formatter.print_info(f"Tasks file: {tasks_file}")
@@ -89,14 +94,14 @@ def undo_last() -> None:
 
     Supports undoing: delete, edit, complete
     """
-    config_loader = ConfigLoader()
-    config = config_loader.load()
+    from todo_cli.models.task import Task
 
-    storage = StorageManager(config.data_dir / "tasks.json")
+    app_ctx = get_app_context()
+    storage = app_ctx.storage
     task_list = storage.load()
 
-    undo_manager = UndoManager(config.data_dir / "undo_history.json")
-    formatter = DisplayFormatter(config)
+    undo_manager = app_ctx.undo
+    formatter = app_ctx.formatter
 
     if not undo_manager.can_undo():
         formatter.print_info("No actions to undo.")
@@ -110,25 +115,30 @@ def undo_last() -> None:
 
     # Undo based on action type
     if action.action_type == "delete":
-        # Restore deleted task
+        # Restore deleted task; the diff holds its full serialized state
+        deleted = Task.from_dict(action.diff)
         task_list.add(
-            action.task.title,
-            priority=action.task.priority.value,
-            tags=action.task.tags,
-            project=action.task.project,
-            due_date=action.task.due_date,
+            deleted.title,
+            priority=deleted.priority.value,
+            tags=deleted.tags,
+            project=deleted.project,
+            due_date=deleted.due_date,
         )
-        formatter.print_success(f"Restored deleted task: {action.task.title}")
+        formatter.print_success(f"Restored deleted task: {deleted.title}")
 
     elif action.action_type == "edit":
-        # Revert edit
-        task = task_list.update(action.task.id, **action.previous_state)
+        # Revert edit; the diff holds only the fields that were changed
+        task = task_list.get_by_id(action.task_id)
         if task:
+            # Round-trip through from_dict to decode the journal's serialized values
+            previous = Task.from_dict({**task.to_dict(), **action.diff})
+            for key in action.diff:
+                setattr(task, key, getattr(previous, key))
             formatter.print_success(f"Reverted edit for task #{task.id}")
 
     elif action.action_type == "complete":
         # Mark as pending
-        task = task_list.mark_pending(action.task.id)
+        task = task_list.mark_pending(action.task_id)
         if task:
             formatter.print_success(f"Marked task #{task.id} as pending: {task.title}")
 
@@ -147,11 +157,10 @@ def config_set(key: str = typer.Argument(..., help="Configuration key"), value:
         todo config set color_enabled false
         todo config set editor vim
     """
-    config_loader = ConfigLoader()
-    formatter = DisplayFormatter(config_loader.load())
+    formatter = get_app_context().formatter
 
     try:
-        config_loader.set(key, value)
+        ConfigLoader().set(key, value)
         formatter.print_success(f"Set {key} = {value}")
     except Exception as e:
         formatter.print_error(f"Failed to set {key}: {e}")
@@ -161,9 +170,9 @@ def config_set(key: str = typer.Argument(..., help="Configuration key"), value:
 @app.command(name="config")
 def config_show() -> None:
     """Display current configuration."""
-    config_loader = ConfigLoader()
-    config = config_loader.load()
-    formatter = DisplayFormatter(config)
+    app_ctx = get_app_context()
+    config = app_ctx.config
+    formatter = app_ctx.formatter
 
     formatter.print_info("Current Configuration:")
     print(f"  Data Directory: {config.data_dir}")
@@ -175,6 +184,7 @@ def config_show() -> None:
     print(f"  Editor: {config.editor or '$EDITOR'}")
     print(f"  Sort By: {config.sort_by}")
     print(f"  Sort Reverse: {config.sort_reverse}")
+    print(f"  Storage Format: {config.storage_format}")
     if config.aliases:
         print(f"  Aliases: {config.aliases}")
 
@@ -1,15 +1,28 @@
 """Config model for user configuration."""
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@functools.lru_cache(maxsize=None)
+def default_data_dir() -> Path:
+    """Return ~/.todo, resolving the home directory only once per process."""
+    return Path.home() / ".todo"
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Config:
     """
     User configuration for the todo application.
 
+    Instances are immutable; use dataclasses.replace() to derive a changed copy.
+
     Attributes:
         data_dir: Directory for storing tasks and config
         default_priority: Default priority for new tasks
@@ -21,9 +34,10 @@ class Config:
         sort_by: Default sort field
         sort_reverse: Default sort direction
         aliases: Custom command aliases
+        storage_format: On-disk task format, "json" or "msgpack"
     """
 
-    data_dir: Path = field(default_factory=lambda: Path.home() / ".todo")
+    data_dir: Path = field(default_factory=default_data_dir)
     default_priority: str = "medium"
     default_tags: List[str] = field(default_factory=list)
     show_completed: bool = True
@@ -33,6 +47,17 @@ class Config:
     sort_by: str = "priority"
     sort_reverse: bool = False
     aliases: Dict[str, str] = field(default_factory=dict)
+    storage_format: str = "json"
+
+    @property
+    def tasks_file(self) -> Path:
+        """Path of the tasks file for the configured storage format."""
+        return self.data_dir / f"tasks.{self.storage_format}"
+
+    @property
+    def undo_history_file(self) -> Path:
+        """Path of the undo history journal."""
+        return self.data_dir / "undo_history.jsonl"
 
     def to_dict(self) -> Dict:
         """Convert config to dictionary for TOML serialization."""
@@ -47,20 +72,14 @@ class Config:
             "sort_by": self.sort_by,
             "sort_reverse": self.sort_reverse,
             "aliases": self.aliases,
+            "storage_format": self.storage_format,
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Config":
         """Create Config from dictionary."""
-        return cls(
-            data_dir=Path(data.get("data_dir", Path.home() / ".todo")),
-            default_priority=data.get("default_priority", "medium"),
-            default_tags=data.get("default_tags", []),
-            show_completed=data.get("show_completed", True),
-            color_enabled=data.get("color_enabled", True),
-            date_format=data.get("date_format", "%Y-%m-%d"),
-            editor=data.get("editor"),
-            sort_by=data.get("sort_by", "priority"),
-            sort_reverse=data.get("sort_reverse", False),
-            aliases=data.get("aliases", {}),
-        )
+        # Pass only the keys present so the field defaults apply to the rest
+        kwargs = {key: data[key] for key in data.keys() & cls.__dataclass_fields__.keys()}
+        if "data_dir" in kwargs:
+            kwargs["data_dir"] = Path(kwargs["data_dir"])
+        return cls(**kwargs)
@@ -5,6 +5,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
+# Clock used for overdue checks; tests swap this for a fixed time
+from todo_cli.utils.date_utils import _now
+
 
 class TaskStatus(str, Enum):
     """Task status enumeration."""
@@ -21,6 +24,12 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
+# Value -> member maps that skip Enum.__call__; str-based members hash like
+# their values, so looking up a member also works
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+_PRIORITY_BY_VALUE = {p.value: p for p in TaskPriority}
+
+
 @dataclass
 class Task:
     """
@@ -46,16 +55,47 @@ class Task:
     created_at: datetime = field(default_factory=datetime.now)
     due_date: Optional[datetime] = None
 
-    def is_overdue(self) -> bool:
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
         """
         Check if the task is overdue.
 
+        Args:
+            now: Reference time; pass one read up front when checking many tasks.
+
         Returns:
             True if task has a due date and it's in the past, False otherwise.
         """
         if self.due_date is None:
             return False
-        return datetime.now() > self.due_date
+        return (now or _now()) > self.due_date
+
+    def format_due(self, date_format: str) -> str:
+        """
+        Format the due date for display, memoized per task.
+
+        The cached string is keyed on the due date and format, so changing
+        either transparently recomputes it. It is not serialized.
+
+        Args:
+            date_format: strftime format string.
+
+        Returns:
+            Formatted due date, or an empty string if there is none.
+        """
+        if self.due_date is None:
+            return ""
+        key = (self.due_date, date_format)
+        cached = self.__dict__.get("_due_fmt")
+        if cached is None or cached[0] != key:
+            due = self.due_date
+            if date_format == "%Y-%m-%d":
+                # The default format, built directly instead of via strftime
+                text = f"{due.year:04d}-{due.month:02d}-{due.day:02d}"
+            else:
+                text = due.strftime(date_format)
+            cached = (key, text)
+            self.__dict__["_due_fmt"] = cached
+        return cached[1]
 
     def to_dict(self) -> Dict:
         """
@@ -89,8 +129,8 @@ class Task:
         return cls(
             id=data["id"],
             title=data["title"],
-            status=TaskStatus(data["status"]),
-            priority=TaskPriority(data["priority"]),
+            status=_STATUS_BY_VALUE[data["status"]],
+            priority=_PRIORITY_BY_VALUE[data["priority"]],
             tags=data.get("tags", []),
             project=data.get("project"),
             created_at=datetime.fromisoformat(data["created_at"]),
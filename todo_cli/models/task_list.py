@@ -1,17 +1,47 @@
 """TaskList model with CRUD operations, filtering, and sorting."""
 
+import heapq
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from todo_cli.models.task import Task, TaskPriority, TaskStatus
+from todo_cli.models import task as task_module
+from todo_cli.models.task import (
+    _PRIORITY_BY_VALUE,
+    _STATUS_BY_VALUE,
+    Task,
+    TaskPriority,
+    TaskStatus,
+)
 
+# Sort rank per priority member, so sorting skips the .value attribute hop
+_PRIORITY_RANK = {TaskPriority.LOW: 1, TaskPriority.MEDIUM: 2, TaskPriority.HIGH: 3}
 
-@dataclass
+
+def _to_status(value: Any) -> TaskStatus:
+    """Resolve a status value or member; raises ValueError if it is invalid."""
+    return _STATUS_BY_VALUE.get(value) or TaskStatus(value)
+
+
+def _to_priority(value: Any) -> TaskPriority:
+    """Resolve a priority value or member; raises ValueError if it is invalid."""
+    return _PRIORITY_BY_VALUE.get(value) or TaskPriority(value)
+
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TaskList:
     """
     Manages a collection of tasks with CRUD operations.
 
+    An id -> task index is kept in step by add/update/delete, so tasks must not
+    be added, removed or replaced by mutating the tasks list directly.
+
     Attributes:
         tasks: List of Task objects
         next_id: Next available task ID
@@ -19,6 +49,11 @@ class TaskList:
 
     tasks: List[Task] = field(default_factory=list)
     next_id: int = 1
+    _by_id: Dict[int, Task] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the id -> task index."""
+        self._by_id = {task.id: task for task in self.tasks}
 
     def add(self, title: str, **kwargs) -> Task:
         """
@@ -34,13 +69,14 @@ class TaskList:
         task = Task(
             id=self.next_id,
             title=title,
-            status=TaskStatus(kwargs.get("status", "pending")),
-            priority=TaskPriority(kwargs.get("priority", "medium")),
+            status=_to_status(kwargs.get("status", "pending")),
+            priority=_to_priority(kwargs.get("priority", "medium")),
             tags=kwargs.get("tags", []),
             project=kwargs.get("project"),
             due_date=kwargs.get("due_date"),
         )
         self.tasks.append(task)
+        self._by_id[task.id] = task
         self.next_id += 1
         return task
 
@@ -54,10 +90,7 @@ class TaskList:
         Returns:
             Task object if found, None otherwise.
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
 
     def update(self, task_id: int, **kwargs) -> Optional[Task]:
         """
@@ -77,9 +110,14 @@ class TaskList:
         for key, value in kwargs.items():
             if value is not None and hasattr(task, key):
                 if key == "status":
-                    task.status = TaskStatus(value)
+                    task.status = _to_status(value)
                 elif key == "priority":
-                    task.priority = TaskPriority(value)
+                    task.priority = _to_priority(value)
+                elif key == "id":
+                    # Move the index entry along with the renumbered task
+                    del self._by_id[task.id]
+                    task.id = value
+                    self._by_id[value] = task
                 else:
                     setattr(task, key, value)
         return task
@@ -97,7 +135,10 @@ class TaskList:
         task = self.get_by_id(task_id)
         if task is None:
             return None
-        self.tasks.remove(task)
+        # Match by identity; list.remove would run the dataclass __eq__ on every earlier task
+        index = next(i for i, t in enumerate(self.tasks) if t is task)
+        del self.tasks[index]
+        del self._by_id[task.id]
         return task
 
     def mark_completed(self, task_id: int) -> Optional[Task]:
@@ -147,25 +188,27 @@ class TaskList:
         Returns:
             List of filtered Task objects.
         """
-        filtered_tasks = self.tasks.copy()
-
-        if status:
-            filtered_tasks = [t for t in filtered_tasks if t.status == status]
-        if priority:
-            filtered_tasks = [t for t in filtered_tasks if t.priority == priority]
-        if tag:
-            filtered_tasks = [t for t in filtered_tasks if tag in t.tags]
-        if project:
-            filtered_tasks = [t for t in filtered_tasks if t.project == project]
-        if overdue_only:
-            filtered_tasks = [t for t in filtered_tasks if t.is_overdue()]
-        if keyword:
-            filtered_tasks = [t for t in filtered_tasks if keyword.lower() in t.title.lower()]
-
-        return filtered_tasks
+        keyword = keyword.lower() if keyword else None
+        now = task_module._now() if overdue_only else None
+
+        # One pass over the tasks, short-circuiting on the first failed criterion
+        return [
+            t
+            for t in self.tasks
+            if (not status or t.status == status)
+            and (not priority or t.priority == priority)
+            and (not tag or tag in t.tags)
+            and (not project or t.project == project)
+            and (not overdue_only or (t.due_date is not None and now > t.due_date))
+            and (not keyword or keyword in t.title.lower())
+        ]
 
     def sort(
-        self, tasks: Optional[List[Task]] = None, by: str = "priority", reverse: bool = False
+        self,
+        tasks: Optional[List[Task]] = None,
+        by: str = "priority",
+        reverse: bool = False,
+        limit: Optional[int] = None,
     ) -> List[Task]:
         """
         Sort tasks by specified criteria.
@@ -174,6 +217,7 @@ class TaskList:
             tasks: List of tasks to sort (defaults to all tasks).
             by: Sort field ('priority', 'due_date', 'created_at', 'title').
             reverse: Sort in descending order.
+            limit: Only return the first N tasks of the sorted order.
 
         Returns:
             Sorted list of Task objects.
@@ -181,24 +225,85 @@ class TaskList:
         if tasks is None:
             tasks = self.tasks
 
-        sort_key: Callable[[Task], any]
+        sort_key: Callable[[Task], Any]
         if by == "priority":
-            priority_order = {"high": 3, "medium": 2, "low": 1}
-            sort_key = lambda t: priority_order[t.priority.value]
+            sort_key = lambda t: _PRIORITY_RANK[t.priority]
         elif by == "due_date":
             sort_key = lambda t: t.due_date or datetime.max
         elif by == "created_at":
-            sort_key = lambda t: t.created_at
+            sort_key = attrgetter("created_at")
         elif by == "title":
             sort_key = lambda t: t.title.lower()
         else:
-            sort_key = lambda t: t.id
+            sort_key = attrgetter("id")
 
+        # Partial selection is cheaper than a full sort when only the top N are needed
+        if limit is not None and limit < len(tasks):
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return select(max(limit, 0), tasks, key=sort_key)
         return sorted(tasks, key=sort_key, reverse=reverse)
 
+    def stats_and_filter(
+        self,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        tag: Optional[str] = None,
+        project: Optional[str] = None,
+        overdue_only: bool = False,
+        keyword: Optional[str] = None,
+    ) -> Tuple[List[Task], int, int, int, int]:
+        """
+        Filter tasks and compute summary counts in a single pass.
+
+        Takes the same criteria as filter(). The counts always cover the
+        whole list, not just the filtered tasks.
+
+        Returns:
+            Tuple of (filtered tasks, total, completed, pending, overdue).
+        """
+        keyword = keyword.lower() if keyword else None
+        now = task_module._now()
+        filtered_tasks: List[Task] = []
+        completed = pending = overdue = 0
+
+        for t in self.tasks:
+            is_overdue = t.due_date is not None and now > t.due_date
+            if t.status is TaskStatus.COMPLETED:
+                completed += 1
+            elif t.status is TaskStatus.PENDING:
+                pending += 1
+            if is_overdue:
+                overdue += 1
+
+            if status and t.status != status:
+                continue
+            if priority and t.priority != priority:
+                continue
+            if tag and tag not in t.tags:
+                continue
+            if project and t.project != project:
+                continue
+            if overdue_only and not is_overdue:
+                continue
+            if keyword and keyword not in t.title.lower():
+                continue
+            filtered_tasks.append(t)
+
+        return filtered_tasks, len(self.tasks), completed, pending, overdue
+
     def get_all(self) -> List[Task]:
-        """Return all tasks."""
-        return self.tasks.copy()
+        """Return all tasks. The list is shared, so callers must not mutate it."""
+        return self.tasks
+
+    def status_counts(self) -> Tuple[int, int, int]:
+        """
+        Count tasks by status in a single pass.
+
+        Returns:
+            Tuple of (total, completed, pending).
+        """
+        completed = sum(1 for t in self.tasks if t.status is TaskStatus.COMPLETED)
+        return len(self.tasks), completed, len(self.tasks) - completed
 
     def count(self, status: Optional[TaskStatus] = None) -> int:
         """
@@ -211,7 +316,10 @@ class TaskList:
             Number of matching tasks.
         """
         if status:
-            return len(self.filter(status=status))
+            _, completed, pending = self.status_counts()
+            # Accept plain values like filter() does; an unknown status matches nothing
+            counts = {TaskStatus.COMPLETED: completed, TaskStatus.PENDING: pending}
+            return counts.get(_STATUS_BY_VALUE.get(status), 0)
         return len(self.tasks)
 
     def to_dict(self) -> Dict:
@@ -1,6 +1,22 @@
 """Storage layer for the To-Do CLI application."""
 
-from todo_cli.storage.config_loader import ConfigError, ConfigLoader
-from todo_cli.storage.storage_manager import StorageError, StorageManager
+from importlib import import_module
+from typing import Any
 
-__all__ = ["StorageManager", "StorageError", "ConfigLoader", "ConfigError"]
+__all__ = ["StorageManager", "StorageError", "ConfigLoader", "ConfigError", "get_config"]
+
+# Exported name -> defining submodule, imported on first access (PEP 562)
+_EXPORTS = {
+    "StorageManager": "todo_cli.storage.storage_manager",
+    "StorageError": "todo_cli.storage.storage_manager",
+    "ConfigLoader": "todo_cli.storage.config_loader",
+    "ConfigError": "todo_cli.storage.config_loader",
+    "get_config": "todo_cli.storage.config_loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names lazily from their submodules."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name]), name)
@@ -1,12 +1,25 @@
 """Config loader for TOML configuration files."""
 
+import copy
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 
-import tomli
 import tomli_w
 
-from todo_cli.models.config import Config
+from todo_cli.models.config import Config, default_data_dir
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib codec
+    orjson = None
 
 
 class ConfigError(Exception):
@@ -15,11 +28,118 @@ class ConfigError(Exception):
     pass
 
 
+def _parse_bool(value: str) -> bool:
+    """Interpret a CLI string as a boolean flag."""
+    return value.lower() in ("true", "1", "yes")
+
+
+def _parse_storage_format(value: str) -> str:
+    """Validate a task storage format name."""
+    value = value.lower()
+    if value not in ("json", "msgpack"):
+        raise ConfigError(f"Unknown storage format: {value}. Must be json or msgpack.")
+    if value == "msgpack":
+        try:
+            import ormsgpack  # noqa: F401
+        except ImportError:
+            raise ConfigError(
+                "msgpack storage requires the ormsgpack package (pip install todo-cli[msgpack])."
+            )
+    return value
+
+
+# Keys readable/settable via ConfigLoader.get/set, with the coercion set() applies
+_FIELD_TYPES: Dict[str, Callable[[str], object]] = {
+    "default_priority": str,
+    "editor": lambda value: value or None,
+    "date_format": str,
+    "sort_by": str,
+    "color_enabled": _parse_bool,
+    "storage_format": _parse_storage_format,
+}
+
+
+def _cache_path(config_path: Path) -> Path:
+    """Return the companion file holding the last parse of a config file."""
+    return config_path.with_name(config_path.name + ".cache")
+
+
+def _content_digest(raw: bytes) -> str:
+    """Hash config file contents to tag and validate the parse cache."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _read_parse_cache(config_path: Path, digest: str) -> Optional[Dict]:
+    """
+    Return the cached parse of a config file if it was made from the same contents.
+
+    Args:
+        config_path: Path to the TOML config file.
+        digest: Content digest of the file as it is now.
+
+    Returns:
+        Parsed TOML data, or None if the cache is missing, stale or unreadable.
+    """
+    try:
+        raw = _cache_path(config_path).read_bytes()
+        cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if cached["blake2b"] == digest:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _reject_date(value: object) -> object:
+    """orjson default hook: refuse dates and times, as the stdlib encoder does."""
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _write_parse_cache(config_path: Path, digest: str, data: Dict) -> None:
+    """Store a config parse next to the file; failures only cost a reparse later."""
+    cached = {"blake2b": digest, "data": data}
+    try:
+        if orjson is not None:
+            # orjson would write TOML dates as strings; route them to _reject_date instead
+            raw = orjson.dumps(cached, default=_reject_date, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        else:
+            raw = json.dumps(cached).encode("utf-8")
+        _cache_path(config_path).write_bytes(raw)
+    except (OSError, TypeError):
+        # TOML dates wouldn't come back as dates from JSON; such configs just aren't cached
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cached(config_path: Path, raw: bytes) -> Config:
+    """
+    Parse a config file, memoized on its contents.
+
+    An edited file misses the cache and is parsed again, whatever its mtime
+    and size. Across processes the parse is reused from a companion ".cache"
+    file tagged with a hash of the same contents, which also avoids importing
+    the TOML parser.
+
+    Args:
+        config_path: Path to the TOML config file.
+        raw: Current contents of the file.
+
+    Returns:
+        Parsed Config object. Callers must not mutate it.
+    """
+    digest = _content_digest(raw)
+    data = _read_parse_cache(config_path, digest)
+    if data is None:
+        import tomli
+
+        data = tomli.loads(raw.decode("utf-8"))
+        _write_parse_cache(config_path, digest, data)
+    return Config.from_dict(data)
+
+
 class ConfigLoader:
     """Manages configuration loading and saving."""
 
-    DEFAULT_CONFIG: Config = Config()
-
     def __init__(self, config_path: Optional[Path] = None) -> None:
         """
         Initialize config loader.
@@ -27,9 +147,19 @@ class ConfigLoader:
         Args:
             config_path: Path to config file. Defaults to ~/.todo/config.toml
         """
-        self.config_path: Path = config_path or Path.home() / ".todo" / "config.toml"
+        self.config_path: Path = config_path or default_data_dir() / "config.toml"
         self._config: Optional[Config] = None
 
+    @classmethod
+    def default_config(cls) -> Config:
+        """
+        Build the configuration used when no config file exists.
+
+        Returns:
+            Fresh Config with default settings.
+        """
+        return Config()
+
     def load(self) -> Config:
         """
         Load configuration from file.
@@ -40,17 +170,19 @@ class ConfigLoader:
         if self._config is not None:
             return self._config
 
-        if not self.config_path.exists():
-            self._config = self.DEFAULT_CONFIG
+        try:
+            raw = self.config_path.read_bytes()
+        except FileNotFoundError:
+            self._config = self.default_config()
             return self._config
 
         try:
-            with open(self.config_path, "rb") as f:
-                data = tomli.load(f)
-            self._config = Config.from_dict(data)
+            config = _load_cached(self.config_path, raw)
         except Exception as e:
             raise ConfigError(f"Failed to load config: {e}")
 
+        # Hand out a private copy so callers can't corrupt the cached instance
+        self._config = copy.deepcopy(config)
         return self._config
 
     def save(self, config: Config) -> None:
@@ -63,7 +195,9 @@ class ConfigLoader:
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_path, "wb") as f:
-                tomli_w.dump(config.to_dict(), f)
+                # TOML has no null; unset optional keys are simply omitted
+                data = {k: v for k, v in config.to_dict().items() if v is not None}
+                tomli_w.dump(data, f)
             self._config = config
         except Exception as e:
             raise ConfigError(f"Failed to save config: {e}")
@@ -79,43 +213,145 @@ class ConfigLoader:
         Returns:
             Configuration value or default.
         """
-        config = self.load()
-        value: Optional[str] = None
-
-        if key == "default_priority":
-            value = config.default_priority
-        elif key == "editor":
-            value = config.editor
-        elif key == "date_format":
-            value = config.date_format
-        elif key == "sort_by":
-            value = config.sort_by
-        elif key == "color_enabled":
-            value = "true" if config.color_enabled else "false"
+        # The settable keys double as the readable ones
+        if key not in _FIELD_TYPES:
+            return default
 
+        value = getattr(self.load(), key)
+        if isinstance(value, bool):
+            value = "true" if value else "false"
         return value or default
 
     def set(self, key: str, value: str) -> None:
         """
         Set a configuration value.
 
+        Only the line holding the key is rewritten, so the rest of the file
+        (comments, ordering, other keys) is left as the user wrote it.
+
+        Changing storage_format converts the existing tasks file to the new
+        format; the old file is kept next to it with a ".migrated" suffix
+        (".migrated.1", ".migrated.2", ... if earlier switches left one behind).
+
         Args:
             key: Configuration key.
             value: Configuration value.
         """
-        config = self.load()
-
-        if key == "default_priority":
-            config.default_priority = value
-        elif key == "editor":
-            config.editor = value if value else None
-        elif key == "date_format":
-            config.date_format = value
-        elif key == "sort_by":
-            config.sort_by = value
-        elif key == "color_enabled":
-            config.color_enabled = value.lower() in ("true", "1", "yes")
-        else:
+        coerce = _FIELD_TYPES.get(key)
+        if coerce is None:
             raise ConfigError(f"Unknown configuration key: {key}")
 
-        self.save(config)
+        coerced = coerce(value)
+        previous = self.load()
+        config = dataclasses.replace(previous, **{key: coerced})
+
+        source, target = previous.tasks_file, config.tasks_file
+        migrate = source != target and source.exists()
+        if migrate:
+            _copy_tasks(source, target)
+
+        try:
+            self._write_key(key, coerced)
+        except Exception as e:
+            if migrate:
+                target.unlink(missing_ok=True)
+            raise ConfigError(f"Failed to save config: {e}")
+
+        if migrate:
+            os.replace(source, _migrated_path(source))
+        self._config = config
+
+    def _write_key(self, key: str, value: object) -> None:
+        """
+        Replace or append a single top-level key in the config file.
+
+        Args:
+            key: Configuration key.
+            value: Already-coerced value; None removes the key.
+        """
+        try:
+            lines = self.config_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        except FileNotFoundError:
+            lines = []
+
+        # Top-level keys live before the first [table] header
+        end = next((i for i, line in enumerate(lines) if line.lstrip().startswith("[")), len(lines))
+        new_line = "" if value is None else tomli_w.dumps({key: value})
+        pattern = re.compile(rf"\s*{re.escape(key)}\s*=")
+
+        for i in range(end):
+            if pattern.match(lines[i]):
+                lines[i] = new_line
+                break
+        else:
+            if end and not lines[end - 1].endswith("\n"):
+                lines[end - 1] += "\n"
+            lines.insert(end, new_line)
+
+        # Write to a temp file and rename so a crash never leaves a half-written config
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.config_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("".join(lines))
+            # mkstemp creates the file 0600; keep the permissions the config had
+            os.chmod(tmp, self._file_mode())
+            os.replace(tmp, self.config_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _file_mode(self) -> int:
+        """Return the config file's permission bits, or the umask default for a new file."""
+        try:
+            return stat.S_IMODE(self.config_path.stat().st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+
+def _copy_tasks(source: Path, target: Path) -> None:
+    """
+    Write the tasks in source to target, in the format target's suffix selects.
+
+    Args:
+        source: Existing tasks file.
+        target: Tasks file for the new storage format.
+    """
+    # Deferred so that loading the config doesn't pull in the storage codecs
+    from todo_cli.storage.storage_manager import StorageError, StorageManager
+
+    if target.exists():
+        raise ConfigError(
+            f"Cannot switch storage format: {target} already exists alongside {source}. "
+            "Move one of them aside first."
+        )
+    try:
+        task_list = StorageManager(source, create_backup=False).load()
+        StorageManager(target, create_backup=False).save(task_list)
+    except StorageError as e:
+        raise ConfigError(f"Failed to convert tasks to {target.name}: {e}")
+
+
+def _migrated_path(source: Path) -> Path:
+    """Return a free name to keep a converted tasks file under, never an existing one."""
+    path = source.with_name(f"{source.name}.migrated")
+    n = 0
+    while path.exists():
+        n += 1
+        path = source.with_name(f"{source.name}.migrated.{n}")
+    return path
+
+
+def get_config(config_path: Optional[Path] = None) -> Config:
+    """
+    Load the user configuration through the process-wide cache.
+
+    Args:
+        config_path: Path to config file. Defaults to ~/.todo/config.toml
+
+    Returns:
+        Config object with loaded settings.
+    """
+    return ConfigLoader(config_path).load()
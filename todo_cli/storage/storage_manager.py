@@ -1,14 +1,188 @@
 """Storage manager with atomic writes and backup support."""
 
+import copy
+import errno
+import functools
+import hashlib
+import importlib
 import json
+import os
 import shutil
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Optional
+from types import ModuleType
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+from todo_cli.models.task import Task
 from todo_cli.models.task_list import TaskList
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    orjson = None
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_codec(name: str) -> Optional[ModuleType]:
+    """
+    Import an optional codec package the first time it is needed.
+
+    Args:
+        name: Module name (ormsgpack, zstandard or msgspec).
+
+    Returns:
+        The module, or None if it isn't installed.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _task_file_decoder() -> Optional[Any]:
+    """Build msgspec's typed decoder for the JSON tasks file, or None without msgspec."""
+    msgspec = _optional_codec("msgspec")
+    if msgspec is None:
+        return None
+
+    class _TaskFile(msgspec.Struct):
+        """Schema of the JSON tasks file; unknown keys (version, ...) are ignored."""
+
+        tasks: List[Task] = []
+        next_id: int = 1
+
+    # Decodes straight into Task dataclasses, enums and datetimes in one pass
+    return msgspec.json.Decoder(_TaskFile)
+
+
+# Suffix of backups compressed with zstd
+_ZST_SUFFIX = ".zst"
+
+# Tasks file format version, written alongside the tasks
+_VERSION = "1.0.0"
+
+
+def _json_default(value: Any) -> Any:
+    """Encode datetimes for the stdlib encoder the same way orjson does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _frame_json(body: bytes, last_modified: datetime) -> bytes:
+    """Append the save metadata to a serialized {"tasks", "next_id"} JSON object."""
+    meta = f',\n  "version": "{_VERSION}",\n  "last_modified": "{last_modified.isoformat()}"\n}}'
+    return body[: body.rindex(b"\n}")] + meta.encode("utf-8")
+
+
+def _unframe_json(raw: bytes) -> Optional[bytes]:
+    """
+    Recover the serialized body from a file written by _frame_json().
+
+    Top-level keys are the only lines indented by two spaces, and strings
+    can't hold raw newlines, so the metadata marker can't occur in the tasks.
+
+    Args:
+        raw: File contents.
+
+    Returns:
+        The body as _dumps() produced it, or None if the layout doesn't match.
+    """
+    end = raw.rfind(b',\n  "version": ')
+    return raw[:end] + b"\n}" if end != -1 else None
+
+
+def _parse_json(raw: bytes) -> TaskList:
+    """
+    Parse the JSON tasks file into a TaskList.
+
+    Uses msgspec's typed decoder when available, skipping the intermediate
+    dicts. Files it rejects (e.g. hand-edited dates that are not RFC 3339)
+    are retried through the lenient TaskList.from_dict() path.
+
+    Args:
+        raw: File contents.
+
+    Returns:
+        Parsed TaskList.
+    """
+    decoder = _task_file_decoder()
+    if decoder is not None:
+        try:
+            parsed = decoder.decode(raw)
+            return TaskList(tasks=parsed.tasks, next_id=parsed.next_id)
+        except _optional_codec("msgspec").ValidationError:
+            pass
+    return TaskList.from_dict(_loads(raw))
+
+
+def _pack(data: Any) -> bytes:
+    """Serialize data to msgpack; Task dataclasses, enums and datetimes are native."""
+    return _optional_codec("ormsgpack").packb(data)
+
+
+def _unpack(raw: bytes) -> Any:
+    """Parse msgpack bytes."""
+    return _optional_codec("ormsgpack").unpackb(raw)
+
+
+def _frame_msgpack(body: bytes, last_modified: datetime) -> bytes:
+    """Widen a packed two-entry map to four and append the save metadata entries."""
+    meta = _pack({"version": _VERSION, "last_modified": last_modified})
+    return b"\x84" + body[1:] + meta[1:]
+
+
+def _unframe_msgpack(raw: bytes) -> Optional[bytes]:
+    """Recover the packed body from a file written by _frame_msgpack(), or None."""
+    # The metadata entries come last, so the final "version" key is theirs
+    end = raw.rfind(_pack("version"))
+    return b"\x82" + raw[1:end] if raw[:1] == b"\x84" and end != -1 else None
+
+
+def _parse_msgpack(raw: bytes) -> TaskList:
+    """Parse the msgpack tasks file into a TaskList."""
+    return TaskList.from_dict(_unpack(raw))
+
+
+def _task_payload(task_list: TaskList) -> Dict:
+    """
+    Build the serializable body of the tasks file.
+
+    orjson encodes Task dataclasses, their enums and datetimes natively, so the
+    tasks are handed over as-is instead of being walked through to_dict().
+
+    Args:
+        task_list: TaskList to serialize.
+
+    Returns:
+        Dictionary ready for _dumps().
+    """
+    if orjson is not None:
+        return {"tasks": task_list.tasks, "next_id": task_list.next_id}
+    return task_list.to_dict()
+
+
+def _content_digest(body: bytes) -> bytes:
+    """Hash the serialized task payload (without save metadata)."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
 
 class StorageError(Exception):
     """Storage-related errors."""
@@ -21,19 +195,52 @@ class StorageManager:
     Manages task storage with atomic writes and backup support.
 
     Ensures data integrity through atomic file operations and backup management.
+    Files ending in ".msgpack" are stored as msgpack (requires ormsgpack);
+    anything else is stored as JSON. With zstandard installed, every backup but
+    the newest is kept zstd-compressed.
     """
 
-    def __init__(self, file_path: Path, create_backup: bool = True) -> None:
+    # Per tasks file: (st_mtime_ns, st_size), the raw file bytes and a parsed
+    # template (built once the file is loaded a second time in this process)
+    _cache: Dict[Path, Tuple[Tuple[int, int], bytes, Optional[TaskList]]] = {}
+
+    def __init__(
+        self,
+        file_path: Path,
+        create_backup: bool = True,
+        paranoid: bool = False,
+        durable: bool = False,
+    ) -> None:
         """
         Initialize storage manager.
 
         Args:
-            file_path: Path to the tasks JSON file.
+            file_path: Path to the tasks file.
             create_backup: Whether to create backups on write.
+            paranoid: Read each written file back and verify it before replacing.
+            durable: fsync the written file and its directory so a save survives
+                power loss, not just a crash of this process.
         """
         self.file_path: Path = file_path
         self.create_backup: bool = create_backup
+        self.paranoid: bool = paranoid
+        self.durable: bool = durable
         self.backup_dir: Path = file_path.parent / "backups"
+        # Digest of the body last saved; for a loaded file it is computed from
+        # _loaded_raw only when a save needs to compare against it
+        self._last_hash: Optional[bytes] = None
+        self._loaded_raw: Optional[bytes] = None
+        # Backup names, oldest first; scanned from disk once, then kept in step
+        self._backups: Optional[Deque[str]] = None
+
+        if file_path.suffix == ".msgpack":
+            if _optional_codec("ormsgpack") is None:
+                raise StorageError("msgpack storage requires the ormsgpack package")
+            self._encode, self._parse = _pack, _parse_msgpack
+            self._frame, self._unframe = _frame_msgpack, _unframe_msgpack
+        else:
+            self._encode, self._parse = _dumps, _parse_json
+            self._frame, self._unframe = _frame_json, _unframe_json
 
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -42,66 +249,174 @@ class StorageManager:
 
     def load(self) -> TaskList:
         """
-        Load tasks from JSON file.
+        Load tasks from the tasks file.
 
         Returns:
             TaskList with loaded tasks.
         """
-        if not self.file_path.exists():
+        try:
+            stat = self.file_path.stat()
+        except FileNotFoundError:
             return TaskList()
 
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(self.file_path)
+        if cached is not None and cached[0] == stat_key:
+            _, raw, template = cached
+            self._last_hash, self._loaded_raw = None, raw
+            if template is None:
+                # Loaded again in this process: keep a parsed template from now on
+                template = self._parse_bytes(raw)
+                self._cache[self.file_path] = (stat_key, raw, template)
+                return self._parse_bytes(raw)
+            return copy.deepcopy(template)
+
+        # First load: hand out the parsed list itself; only the bytes are kept
+        raw = self.file_path.read_bytes()
+        task_list = self._parse_bytes(raw)
+        self._last_hash, self._loaded_raw = None, raw
+        self._cache[self.file_path] = (stat_key, raw, None)
+        return task_list
+
+    def _known_digest(self) -> Optional[bytes]:
+        """Return the digest of the body last loaded or saved, hashing a loaded file lazily."""
+        if self._last_hash is None and self._loaded_raw is not None:
+            body = self._unframe(self._loaded_raw)
+            self._last_hash = _content_digest(body) if body is not None else None
+            self._loaded_raw = None
+        return self._last_hash
+
+    def _parse_bytes(self, raw: bytes) -> TaskList:
+        """Parse tasks file contents, reporting malformed data as a StorageError."""
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return TaskList.from_dict(data)
-        except (json.JSONDecodeError, KeyError) as e:
+            return self._parse(raw)
+        except (ValueError, KeyError) as e:  # JSON and msgpack decode errors are ValueErrors
             raise StorageError(f"Failed to load tasks: {e}")
 
-    def save(self, task_list: TaskList) -> None:
+    def save(self, task_list: TaskList, force: bool = False) -> None:
         """
-        Save tasks to JSON file with atomic write.
+        Save tasks to the tasks file with atomic write.
+
+        The write (and backup) is skipped when the task list is identical to
+        what was last loaded or saved through this manager.
 
         Args:
             task_list: TaskList to save.
+            force: Write even if the task list is unchanged.
         """
+        # Serialize once: the body is hashed, then framed with the save metadata
+        body = self._encode(_task_payload(task_list))
+        digest = _content_digest(body)
+        if not force and self.file_path.exists() and digest == self._known_digest():
+            return
+
         # Create backup if enabled
         if self.create_backup and self.file_path.exists():
             self._create_backup()
 
         # Atomic write using temporary file
-        data = task_list.to_dict()
-        data["version"] = "1.0.0"
-        data["last_modified"] = datetime.now().isoformat()
-
+        payload = self._frame(body, datetime.now())
+        tmp_path: Optional[Path] = None
         try:
+            # NamedTemporaryFile creates the file with O_CREAT | O_EXCL
             with NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
+                mode="wb",
                 dir=self.file_path.parent,
                 delete=False,
                 prefix=f"{self.file_path.name}.",
                 suffix=".tmp",
             ) as tmp_file:
-                json.dump(data, tmp_file, indent=2, ensure_ascii=False)
                 tmp_path = Path(tmp_file.name)
+                tmp_file.write(payload)
+                if self.durable:
+                    tmp_file.flush()
+                    os.fsync(tmp_file.fileno())
+
+            if self.paranoid and tmp_path.read_bytes() != payload:
+                raise StorageError("Failed to save tasks: written data did not verify")
 
-            # Atomic replace
-            tmp_path.replace(self.file_path)
+            # Atomic replace, then (if durable) persist the rename itself
+            os.replace(tmp_path, self.file_path)
+            tmp_path = None
+            if self.durable:
+                self._fsync_dir()
+            self._last_hash, self._loaded_raw = digest, None
         except (IOError, OSError) as e:
             raise StorageError(f"Failed to save tasks: {e}")
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            self._cache.pop(self.file_path, None)
+
+    def _fsync_dir(self) -> None:
+        """Flush the parent directory entry so a completed rename survives a crash."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return  # Not supported (e.g. Windows); os.replace is already atomic there
+        fd = os.open(self.file_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            # Some filesystems (e.g. SMB mounts) can't fsync a directory
+            if e.errno not in (errno.EINVAL, errno.ENOTSUP):
+                raise
+        finally:
+            os.close(fd)
 
     def _create_backup(self) -> None:
         """Create timestamped backup of current file."""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        backup_path = self.backup_dir / f"{self.file_path.name}.{timestamp}"
+        name = f"{self.file_path.name}.{timestamp}"
 
-        # Keep only last 10 backups
-        backups = sorted(self.backup_dir.glob(f"{self.file_path.name}.*"))
-        while len(backups) > 10:
-            backups[0].unlink()
-            backups.pop(0)
+        backups = self._cached_backup_names()
+        if backups and backups[-1] == name:
+            # Same-second backup is replaced below
+            (self.backup_dir / backups.pop()).unlink(missing_ok=True)
 
-        shutil.copy2(self.file_path, backup_path)
+        # Keep only last 10 backups (including the one about to be written)
+        while len(backups) > 9:
+            (self.backup_dir / backups.popleft()).unlink(missing_ok=True)
+
+        # save() always swaps in a new file via os.replace, so the current file's
+        # inode is never written again and a hard link is a safe zero-copy backup
+        try:
+            os.link(self.file_path, self.backup_dir / name)
+        except OSError:  # Cross-device, or links unsupported by the filesystem
+            shutil.copy2(self.file_path, self.backup_dir / name)
+
+        if backups and _optional_codec("zstandard") is not None:
+            self._compress_backup(backups)
+        backups.append(name)
+
+    def _compress_backup(self, backups: Deque[str]) -> None:
+        """Replace the newest existing backup with a zstd-compressed copy."""
+        name = backups[-1]
+        if name.endswith(_ZST_SUFFIX):
+            return
+
+        path = self.backup_dir / name
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return
+        compressed = _optional_codec("zstandard").ZstdCompressor(level=3).compress(data)
+        (self.backup_dir / f"{name}{_ZST_SUFFIX}").write_bytes(compressed)
+        path.unlink()
+        backups[-1] = f"{name}{_ZST_SUFFIX}"
+
+    def _cached_backup_names(self) -> Deque[str]:
+        """Return backup file names for this tasks file, oldest first, scanning only once."""
+        if self._backups is None:
+            self._backups = deque(self._backup_names())
+        return self._backups
+
+    def _backup_names(self) -> List[str]:
+        """Scan the backup directory for this tasks file's backups, oldest first."""
+        prefix = f"{self.file_path.name}."
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                return sorted(e.name for e in entries if e.name.startswith(prefix))
+        except FileNotFoundError:
+            return []
 
     def restore_backup(self, backup_timestamp: str) -> None:
         """
@@ -111,10 +426,20 @@ class StorageManager:
             backup_timestamp: Timestamp of backup to restore.
         """
         backup_path = self.backup_dir / f"{self.file_path.name}.{backup_timestamp}"
-        if not backup_path.exists():
+        compressed_path = backup_path.with_name(f"{backup_path.name}{_ZST_SUFFIX}")
+        if backup_path.exists():
+            shutil.copy2(backup_path, self.file_path)
+        elif compressed_path.exists():
+            zstandard = _optional_codec("zstandard")
+            if zstandard is None:
+                raise StorageError("Compressed backups require the zstandard package")
+            data = zstandard.ZstdDecompressor().decompress(compressed_path.read_bytes())
+            self.file_path.write_bytes(data)
+        else:
             raise StorageError(f"Backup not found: {backup_timestamp}")
 
-        shutil.copy2(backup_path, self.file_path)
+        self._cache.pop(self.file_path, None)
+        self._last_hash, self._loaded_raw = None, None
 
     def list_backups(self) -> list[str]:
         """
@@ -123,5 +448,5 @@ class StorageManager:
         Returns:
             List of backup timestamps.
         """
-        backups = sorted(self.backup_dir.glob(f"{self.file_path.name}.*"))
-        return [b.name.split(".", 2)[2] for b in backups]
+        prefix_len = len(self.file_path.name) + 1
+        return [name[prefix_len:].removesuffix(_ZST_SUFFIX) for name in self._cached_backup_names()]
@@ -1,7 +1,57 @@
 """Date utilities for parsing and formatting dates."""
 
+import functools
+import re
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# "Now" pinned for the duration of one command; None means read the clock
+_NOW: ContextVar[Optional[datetime]] = ContextVar("now", default=None)
+
+# Natural-language dates, as day offsets from today
+_NAMED_OFFSETS = {"today": 0, "tomorrow": 1}
+
+# All numeric date forms in one pass; the named group that matched picks the form
+_DATE = re.compile(
+    r"\+(?P<offset>\d+)"
+    r"|(?P<year>\d{4})-(?P<ymonth>\d{1,2})-(?P<yday>\d{1,2})"
+    r"|(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+)
+
+
+def _now() -> datetime:
+    """Return the pinned command time, or the current time if none is set."""
+    return _NOW.get() or datetime.now()
+
+
+def _today() -> datetime:
+    """Return midnight at the start of the current (or pinned) day."""
+    return _now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def pin_now(func: F) -> F:
+    """
+    Decorate a command so every date check within it sees the same instant.
+
+    Args:
+        func: Command function to wrap.
+
+    Returns:
+        Wrapped function that pins "now" while it runs.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _NOW.set(datetime.now())
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _NOW.reset(token)
+
+    return wrapper  # type: ignore[return-value]
 
 
 def parse_date(date_str: str) -> Optional[datetime]:
@@ -22,45 +72,38 @@ def parse_date(date_str: str) -> Optional[datetime]:
         Datetime object or None if parsing fails.
     """
     date_str = date_str.lower().strip()
-    now = datetime.now()
-    today = now.date()
 
     # Natural language dates
-    if date_str == "today":
-        return datetime.combine(today, datetime.min.time())
-    elif date_str == "tomorrow":
-        tomorrow = today + timedelta(days=1)
-        return datetime.combine(tomorrow, datetime.min.time())
-
-    # Relative dates (+N)
-    if date_str.startswith("+"):
-        try:
-            days = int(date_str[1:])
-            target_date = today + timedelta(days=days)
-            return datetime.combine(target_date, datetime.min.time())
-        except ValueError:
-            return None
+    offset = _NAMED_OFFSETS.get(date_str)
+    if offset is not None:
+        return _today() + timedelta(days=offset)
 
-    # YYYY-MM-DD format
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
-    except ValueError:
-        pass
+    match = _DATE.fullmatch(date_str)
+    if match is None:
+        return None
 
-    # MM-DD format (current year)
     try:
-        date_without_year = datetime.strptime(date_str, "%m-%d")
-        target_date = date_without_year.replace(year=now.year)
+        # YYYY-MM-DD format; the only form that doesn't need the clock
+        if match["year"]:
+            return datetime(int(match["year"]), int(match["ymonth"]), int(match["yday"]))
+
+        today = _today()
+
+        # Relative dates (+N)
+        if match["offset"]:
+            return today + timedelta(days=int(match["offset"]))
+
+        # MM-DD format (current year)
+        target_date = datetime(today.year, int(match["month"]), int(match["day"]))
 
         # If date has passed this year, use next year
-        if target_date.date() < today:
-            target_date = target_date.replace(year=now.year + 1)
+        if target_date < today:
+            target_date = target_date.replace(year=today.year + 1)
 
         return target_date
     except ValueError:
-        pass
-
-    return None
+        # Out-of-range month/day (e.g. 2026-02-30)
+        return None
 
 
 def format_date(dt: datetime, format_str: str = "%Y-%m-%d") -> str:
@@ -77,27 +120,29 @@ def format_date(dt: datetime, format_str: str = "%Y-%m-%d") -> str:
     return dt.strftime(format_str)
 
 
-def is_overdue(due_date: Optional[datetime]) -> bool:
+def is_overdue(due_date: Optional[datetime], now: Optional[datetime] = None) -> bool:
     """
     Check if a due date is overdue.
 
     Args:
         due_date: Due date to check.
+        now: Reference time; pass one read up front when checking many dates.
 
     Returns:
         True if overdue, False otherwise.
     """
     if due_date is None:
         return False
-    return datetime.now() > due_date
+    return (now or _now()) > due_date
 
 
-def get_days_until(due_date: Optional[datetime]) -> Optional[int]:
+def get_days_until(due_date: Optional[datetime], now: Optional[datetime] = None) -> Optional[int]:
     """
     Get number of days until due date.
 
     Args:
         due_date: Due date.
+        now: Reference time; pass one read up front when checking many dates.
 
     Returns:
         Number of days until due, None if no due date.
@@ -105,5 +150,5 @@ def get_days_until(due_date: Optional[datetime]) -> Optional[int]:
     if due_date is None:
         return None
 
-    delta = (due_date - datetime.now()).days
+    delta = (due_date - (now or _now())).days
     return delta
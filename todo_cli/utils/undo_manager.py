@@ -1,13 +1,34 @@
 """Undo manager for tracking and reverting destructive actions."""
 
 import json
-from dataclasses import dataclass, field
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional
 
 from todo_cli.models.task import Task
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
+
+
+def _dump_line(data: Any) -> bytes:
+    """Serialize data as one compact JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, default=str).encode("utf-8") + b"\n"
+
+
+def _load_line(line: bytes) -> Any:
+    """Parse one JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
 
 @dataclass
 class UndoAction:
@@ -16,30 +37,74 @@ class UndoAction:
 
     Attributes:
         action_type: Type of action (delete, edit, complete, etc.)
-        task: Task that was affected
-        previous_state: Previous state of task (for edits)
+        task_id: ID of the task that was affected
+        diff: Previous values of the changed fields; for deletes, the whole
+            task as serialized by Task.to_dict()
         timestamp: When the action occurred
     """
 
     action_type: str
-    task: Task
-    previous_state: Optional[Dict] = None
+    task_id: int
+    diff: Dict = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
 
 
 class UndoManager:
-    """Manages undo history for destructive actions."""
+    """
+    Manages undo history for destructive actions.
+
+    History is kept in an append-only JSON Lines journal: recording an action
+    appends a single line without reading the file. The journal is only read
+    when the history is first accessed, and only rewritten when an action is
+    undone, the history is cleared, or the journal needs compacting. Inside
+    batch(), recorded lines are buffered and appended in a single write.
+    """
+
+    MAX_HISTORY = 50
 
     def __init__(self, history_file: Path) -> None:
         """
         Initialize undo manager.
 
         Args:
-            history_file: Path to undo history file.
+            history_file: Path to undo history journal.
         """
         self.history_file: Path = history_file
-        self.history: List[UndoAction] = []
-        self._load_history()
+        self._history: Optional[Deque[UndoAction]] = None
+        # Journal lines recorded inside batch() and not yet written
+        self._pending: Optional[List[bytes]] = None
+
+    @property
+    def history(self) -> Deque[UndoAction]:
+        """Undo actions, oldest first; a bounded deque that evicts the oldest on append."""
+        if self._history is None:
+            self.flush()
+            self._history = self._load_history()
+        return self._history
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Buffer actions recorded in the block and append them to the journal at once.
+
+        Nested batches join the outermost one.
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = []
+        try:
+            yield
+        finally:
+            self.flush()
+            self._pending = None
+
+    def flush(self) -> None:
+        """Append any actions buffered by batch() to the journal."""
+        if self._pending:
+            self._append(self._pending)
+            self._pending.clear()
 
     def record_delete(self, task: Task) -> None:
         """
@@ -48,21 +113,23 @@ class UndoManager:
         Args:
             task: The deleted task.
         """
-        action = UndoAction(action_type="delete", task=task)
-        self.history.append(action)
-        self._save_history()
+        self._record(UndoAction(action_type="delete", task_id=task.id, diff=task.to_dict()))
 
     def record_edit(self, task: Task, previous_state: Dict) -> None:
         """
         Record a task edit for undo.
 
+        Only fields whose value actually changed are kept, in their
+        Task.to_dict() form.
+
         Args:
             task: The edited task.
-            previous_state: Previous task state.
+            previous_state: Previous values of the edited fields.
         """
-        action = UndoAction(action_type="edit", task=task, previous_state=previous_state)
-        self.history.append(action)
-        self._save_history()
+        current = task.to_dict()
+        previous = replace(task, **previous_state).to_dict()
+        diff = {key: previous[key] for key in previous_state if previous[key] != current[key]}
+        self._record(UndoAction(action_type="edit", task_id=task.id, diff=diff))
 
     def record_complete(self, task: Task) -> None:
         """
@@ -71,9 +138,9 @@ class UndoManager:
         Args:
             task: The completed task.
         """
-        action = UndoAction(action_type="complete", task=task, previous_state={"status": "pending"})
-        self.history.append(action)
-        self._save_history()
+        self._record(
+            UndoAction(action_type="complete", task_id=task.id, diff={"status": "pending"})
+        )
 
     def can_undo(self) -> bool:
         """Check if undo is available."""
@@ -99,44 +166,81 @@ class UndoManager:
 
     def clear_history(self) -> None:
         """Clear all undo history."""
-        self.history = []
+        self._history = deque(maxlen=self.MAX_HISTORY)
         self._save_history()
 
+    def _record(self, action: UndoAction) -> None:
+        """Append an action to the in-memory history (if loaded) and the journal."""
+        if self._history is not None:
+            self._history.append(action)
+
+        line = _dump_line(self._serialize(action))
+        if self._pending is not None:
+            self._pending.append(line)
+        else:
+            self._append([line])
+
+    def _append(self, lines: List[bytes]) -> None:
+        """Append serialized lines to the journal in one write."""
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.history_file, "ab") as f:
+            f.write(b"".join(lines))
+
     def _save_history(self) -> None:
-        """Save undo history to file."""
-        # Keep only last 50 actions
-        self.history = self.history[-50:]
-
-        data = [
-            {
-                "action_type": action.action_type,
-                "task": action.task.to_dict(),
-                "previous_state": action.previous_state,
-                "timestamp": action.timestamp.isoformat(),
-            }
-            for action in self.history
-        ]
-
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
-
-    def _load_history(self) -> None:
-        """Load undo history from file."""
+        """Rewrite the journal from the in-memory history."""
+        history = self.history
+        # Buffered actions are already in the loaded history being written out
+        if self._pending:
+            self._pending.clear()
+
+        with open(self.history_file, "wb") as f:
+            f.writelines(_dump_line(self._serialize(action)) for action in history)
+
+    def _load_history(self) -> Deque[UndoAction]:
+        """Load undo history from the journal, compacting it if it grew too long."""
+        history: Deque[UndoAction] = deque(maxlen=self.MAX_HISTORY)
         if not self.history_file.exists():
-            return
+            return history
 
+        # Stream the journal keeping only the raw tail; older lines are never parsed
+        tail: Deque[bytes] = deque(maxlen=self.MAX_HISTORY)
+        line_count = 0
         try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.history = [
-                UndoAction(
-                    action_type=item["action_type"],
-                    task=Task.from_dict(item["task"]),
-                    previous_state=item.get("previous_state"),
-                    timestamp=datetime.fromisoformat(item["timestamp"]),
-                )
-                for item in data
-            ]
-        except Exception:
-            self.history = []
+            with open(self.history_file, "rb") as f:
+                for line in f:
+                    line_count += 1
+                    tail.append(line)
+        except OSError:
+            return history
+
+        for line in tail:
+            try:
+                history.append(self._deserialize(_load_line(line)))
+            except (ValueError, KeyError, TypeError):
+                # Skip torn or malformed lines rather than losing the journal
+                continue
+
+        if line_count > 2 * self.MAX_HISTORY:
+            self._history = history
+            self._save_history()
+        return history
+
+    @staticmethod
+    def _serialize(action: UndoAction) -> Dict:
+        """Convert an action to a JSON-serializable dictionary."""
+        return {
+            "action_type": action.action_type,
+            "task_id": action.task_id,
+            "diff": action.diff,
+            "timestamp": action.timestamp.isoformat(),
+        }
+
+    @staticmethod
+    def _deserialize(item: Dict) -> UndoAction:
+        """Build an action from a journal entry."""
+        return UndoAction(
+            action_type=item["action_type"],
+            task_id=item["task_id"],
+            diff=item["diff"],
+            timestamp=datetime.fromisoformat(item["timestamp"]),
+        )
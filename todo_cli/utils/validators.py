@@ -1,11 +1,11 @@
 """Input validation utilities."""
 
-from typing import List, Optional
+from typing import Collection, List, Optional
 
-from todo_cli.models.task import TaskPriority, TaskStatus
+from todo_cli.models.task import _PRIORITY_BY_VALUE, _STATUS_BY_VALUE, TaskPriority, TaskStatus
 
 
-def validate_priority(priority: str) -> Optional[str]:
+def validate_priority(priority: str) -> Optional[TaskPriority]:
     """
     Validate priority value.
 
@@ -13,15 +13,12 @@ def validate_priority(priority: str) -> Optional[str]:
         priority: Priority string to validate.
 
     Returns:
-        Validated priority or None if invalid.
+        Matching TaskPriority (compares equal to its string value) or None if invalid.
     """
-    try:
-        return TaskPriority(priority.lower()).value
-    except ValueError:
-        return None
+    return _PRIORITY_BY_VALUE.get(priority.lower())
 
 
-def validate_status(status: str) -> Optional[str]:
+def validate_status(status: str) -> Optional[TaskStatus]:
     """
     Validate status value.
 
@@ -29,35 +26,26 @@ def validate_status(status: str) -> Optional[str]:
         status: Status string to validate.
 
     Returns:
-        Validated status or None if invalid.
+        Matching TaskStatus (compares equal to its string value) or None if invalid.
     """
-    try:
-        return TaskStatus(status.lower()).value
-    except ValueError:
-        return None
+    return _STATUS_BY_VALUE.get(status.lower())
 
 
 def validate_tags(tags: List[str]) -> List[str]:
     """
     Validate and normalize tag list.
 
+    Entries may themselves be comma-separated (e.g. "work,urgent").
+
     Args:
         tags: List of tag strings.
 
     Returns:
         Normalized list of tags (lowercase, trimmed, no duplicates).
     """
-    # Normalize: lowercase, trim, remove empty, remove duplicates
-    normalized = []
-    seen = set()
-
-    for tag in tags:
-        tag = tag.strip().lower()
-        if tag and tag not in seen:
-            normalized.append(tag)
-            seen.add(tag)
-
-    return normalized
+    # Split on commas, normalize, drop empties; dict.fromkeys dedups in order
+    normalized = (part.strip().lower() for tag in tags for part in tag.split(","))
+    return list(dict.fromkeys(tag for tag in normalized if tag))
 
 
 def validate_project(project: Optional[str]) -> Optional[str]:
@@ -77,13 +65,13 @@ def validate_project(project: Optional[str]) -> Optional[str]:
     return project if project else None
 
 
-def validate_task_id(task_id: int, valid_ids: List[int]) -> bool:
+def validate_task_id(task_id: int, valid_ids: Collection[int]) -> bool:
     """
     Validate that task ID exists.
 
     Args:
         task_id: Task ID to validate.
-        valid_ids: List of valid task IDs.
+        valid_ids: Valid task IDs; pass a set for O(1) membership checks.
 
     Returns:
         True if valid, False otherwise.